@@ -3,36 +3,166 @@ Device Manager Module
 Handles WMI queries for hardware device detection and information retrieval.
 """
 import re
-import pythoncom
-from typing import List, Dict, Tuple, Optional, Any
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from types import SimpleNamespace
+from typing import List, Dict, Tuple, Optional, Any, Callable, Iterator
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# WMI hands back a fresh string per row; low-cardinality fields (status,
+# manufacturer, driver, media type) are interned so devices share one copy
+_intern = sys.intern
+
+# Common patterns: VID_xxxx&PID_yyyy or VEN_xxxx&DEV_yyyy
+_VIDPID_RE = re.compile(r'(?P<k>VID|VEN|PID|DEV)_(?P<v>[0-9A-Fa-f]{4})')
+_VIDPID_KEYS = {"VID": "vid", "VEN": "vid", "PID": "pid", "DEV": "pid"}
+_VIDPID_TOKENS = ("VID_", "VEN_", "PID_", "DEV_")
+
+# Key value of an association reference, e.g.
+# \\HOST\root\cimv2:Win32_DiskDrive.DeviceID="\\\\.\\PHYSICALDRIVE0"
+_WMI_REF_ID_RE = re.compile(r'DeviceID="((?:[^"\\]|\\.)*)"')
+
+# SWbemServices.ExecQuery flags: wbemFlagReturnImmediately | wbemFlagForwardOnly
+WBEM_FLAG_RETURN_IMMEDIATELY = 0x10
+WBEM_FLAG_FORWARD_ONLY = 0x20
+
+# Size of the WMI query pool: one worker per independent query group
+# (PnP, network, storage)
+_QUERY_WORKERS = 3
+
+# Software-enumerated devices live under the ROOT\ bus
+_ROOT_PREFIX = "ROOT\\"
+
+# Virtual device indicators (name, device ID, or manufacturer)
+_VIRTUAL_RE = re.compile(
+    r'virtual|vmware|virtualbox|hyper-?v|tap-windows|loopback|pseudo|vethernet|'
+    r'vbox|qemu|kvm|parallels|vpn|tunnel|bridge|vnic|ram ?disk',
+    re.IGNORECASE
+)
+
+# Row field extractors, one C-level call per row instead of repeated attribute reads
+_PNP_FIELDS = attrgetter("DeviceID", "Name", "Description", "Manufacturer", "Status", "Service")
+_NETWORK_FIELDS = attrgetter("Name", "Manufacturer", "PNPDeviceID", "AdapterType", "NetConnectionStatus", "ServiceName")
+_STORAGE_FIELDS = attrgetter("DeviceID", "Model", "Caption", "Manufacturer", "MediaType", "InterfaceType", "Status")
+
+# PnP entity query; the per-category conditions are ORed into one query, and
+# run one by one if that fails. Order matches _collect_pnp_devices' result.
+_PNP_SELECT = "SELECT DeviceID,Name,Description,Manufacturer,Status,Service FROM Win32_PnPEntity WHERE "
+_PNP_CONDITIONS = (
+    ("USB", "DeviceID LIKE 'USB%'"),
+    ("HID", "DeviceID LIKE 'HID%'"),
+    ("Bluetooth", "DeviceID LIKE 'BTH%' OR Service='BTHUSB'"),
+    ("Display", "Service='monitor' OR DeviceID LIKE 'DISPLAY%'"),
+)
+
+# Keyword -> label tables, checked in order (first match wins)
+# USB entries also say whether the name is searched, or only the description
+_USB_TYPES = (
+    (("hub",), True, "USB Hub", "USB Port"),
+    (("controller",), True, "USB Controller", "USB Port"),
+    (("composite",), False, "USB Composite Device", "USB"),
+)
+_HID_CATEGORIES = (
+    (("keyboard",), "Keyboard"),
+    (("mouse",), "Mouse"),
+)
+_NETWORK_CATEGORIES = (
+    (("ethernet", "gbe", "gigabit"), "Ethernet"),
+    (("wi-fi", "wireless", "802.11"), "Wi-Fi"),
+)
+
+
+def _parse_wmi_ref_id(ref: Optional[str]) -> Optional[str]:
+    """Extract the unescaped DeviceID key from a WMI object path reference."""
+    if not ref:
+        return None
+    match = _WMI_REF_ID_RE.search(ref)
+    if not match:
+        return None
+    return match.group(1).replace('\\\\', '\\')
+
+
+class _ThreadCom:
+    """
+    COM state of one query pool thread, kept in thread-local storage.
+    
+    CPython clears a thread's locals on that thread as it exits, so the
+    apartment is uninitialized by the thread that initialized it.
+    """
+    
+    def __init__(self):
+        import pythoncom
+        pythoncom.CoInitialize()
+        self.wmi_connection: Any = None
+    
+    def __del__(self):
+        self.wmi_connection = None
+        try:
+            import pythoncom
+            pythoncom.CoUninitialize()
+        except Exception:
+            pass
+
 
 class DeviceManager:
     """Manages device detection and information retrieval using Windows WMI."""
     
     def __init__(self):
         """Initialize the Device Manager."""
-        self._wmi_connection = None
+        # COM objects are apartment-bound, so each thread keeps its own
+        # connection, held by a _ThreadCom that releases it when the thread exits
+        self._local = threading.local()
+        # DeviceID -> (source fields, parsed device) from the previous enumeration
+        self._device_cache: Dict[Tuple, Tuple[Tuple, Dict[str, str]]] = {}
+        # One worker per independent query group (PnP, network, storage); the
+        # threads persist so their cached WMI connections are reused
+        self._query_pool = ThreadPoolExecutor(max_workers=_QUERY_WORKERS, thread_name_prefix="wmi-query")
+        # Guards closed against get_all_devices submitting to a pool being shut down
+        self._pool_lock = threading.Lock()
+        self.closed = False
     
     def _get_wmi(self) -> Any:
         """
-        Get or create WMI connection with proper COM initialization.
+        Get or create the calling thread's WMI connection with proper COM initialization.
         
         Returns:
-            WMI connection object
+            SWbemServices connection to root\\cimv2
         """
+        com = getattr(self._local, "com", None)
+        if com is not None and com.wmi_connection is not None:
+            return com.wmi_connection
+        
         try:
-            pythoncom.CoInitialize()
-            import wmi
-            return wmi.WMI()
+            if com is None:
+                com = self._local.com = _ThreadCom()
+            import win32com.client
+            locator = win32com.client.Dispatch("WbemScripting.SWbemLocator")
+            com.wmi_connection = locator.ConnectServer(".", "root\\cimv2")
         except Exception as e:
             logger.error(f"Failed to initialize WMI connection: {e}")
             raise
+        
+        return com.wmi_connection
+
+    def close(self) -> None:
+        """
+        Stop the query pool, releasing each pool thread's WMI connection.
+        
+        Queries already submitted finish first; get_all_devices raises afterwards.
+        """
+        with self._pool_lock:
+            if self.closed:
+                return
+            self.closed = True
+        # The pool threads exit once their queued work is done, each releasing
+        # its own connection (see _ThreadCom)
+        self._query_pool.shutdown(wait=True)
 
     def _parse_vid_pid(self, device_id: Optional[str]) -> Tuple[str, str]:
         """
@@ -44,25 +174,24 @@ class DeviceManager:
         Returns:
             Tuple of (vendor_id, product_id) as hex strings
         """
-        vid = "N/A"
-        pid = "N/A"
-        
         if not device_id:
-            return vid, pid
+            return "N/A", "N/A"
         
-        try:
-            # Common patterns: VID_xxxx&PID_yyyy or VEN_xxxx&DEV_yyyy
-            vid_match = re.search(r'(?:VID_|VEN_)([0-9A-Fa-f]{4})', device_id)
-            pid_match = re.search(r'(?:PID_|DEV_)([0-9A-Fa-f]{4})', device_id)
-            
-            if vid_match:
-                vid = "0x" + vid_match.group(1).upper()
-            if pid_match:
-                pid = "0x" + pid_match.group(1).upper()
-        except Exception as e:
-            logger.warning(f"Failed to parse VID/PID from {device_id}: {e}")
-            
-        return vid, pid
+        # Storage, network and display IDs carry no ID tokens; skip the regex
+        if not any(token in device_id for token in _VIDPID_TOKENS):
+            return "N/A", "N/A"
+        
+        # Single scan; the first VID/VEN and first PID/DEV token win
+        found = {}
+        for m in _VIDPID_RE.finditer(device_id):
+            found.setdefault(_VIDPID_KEYS[m.group("k")], m.group("v"))
+            if len(found) == 2:
+                break
+        
+        vid = found.get("vid")
+        pid = found.get("pid")
+        return (_intern(f"0x{vid.upper()}") if vid else "N/A",
+                _intern(f"0x{pid.upper()}") if pid else "N/A")
 
     def _is_virtual_device(self, name: str, device_id: str, manufacturer: str = "") -> str:
         """
@@ -79,23 +208,13 @@ class DeviceManager:
         if not name:
             return "Physical"
         
-        # Virtual device indicators
-        virtual_keywords = [
-            "virtual", "vmware", "virtualbox", "hyper-v", "hyperv",
-            "tap-windows", "loopback", "pseudo", "vethernet",
-            "vbox", "qemu", "kvm", "parallels", "vpn",
-            "tunnel", "bridge", "vnic", "ramdisk", "ram disk"
-        ]
+        # Check for ROOT\ prefix first (often indicates virtual/software devices);
+        # it is far cheaper than building and scanning the combined text
+        if device_id and device_id[:5].upper() == _ROOT_PREFIX:
+            return "Virtual"
         
         # Check name, device ID, and manufacturer
-        search_text = f"{name} {device_id} {manufacturer}".lower()
-        
-        for keyword in virtual_keywords:
-            if keyword in search_text:
-                return "Virtual"
-        
-        # Check for ROOT\ prefix (often indicates virtual/software devices)
-        if device_id and device_id.upper().startswith("ROOT\\"):
+        if _VIRTUAL_RE.search(f"{name} {device_id} {manufacturer}"):
             return "Virtual"
         
         return "Physical"
@@ -104,96 +223,225 @@ class DeviceManager:
         """
         Retrieve all connected devices from various categories.
         
+        The PnP, network and storage queries are independent and spend most of
+        their time blocked on DCOM, so they run concurrently on the query pool.
+        
         Returns:
             List of device dictionaries containing device information
+            
+        Raises:
+            RuntimeError: If the manager has been closed
         """
+        next_cache = {}
+        with self._pool_lock:
+            if self.closed:
+                raise RuntimeError("DeviceManager is closed")
+            pnp = self._query_pool.submit(self._run_query_job, self._collect_pnp_devices, next_cache)
+            network = self._query_pool.submit(self._run_query_job, self._collect_network_devices, next_cache)
+            storage = self._query_pool.submit(self._run_query_job, self._collect_storage_devices, next_cache)
+        
+        usb_devices, hid_devices, bt_devices, display_devices = pnp.result() or ([], [], [], [])
+        
+        # Keep the original category order: USB, HID, Network, Storage, Bluetooth, Display
         devices = []
+        devices.extend(usb_devices)
+        devices.extend(hid_devices)
+        devices.extend(network.result() or [])
+        devices.extend(storage.result() or [])
+        devices.extend(bt_devices)
+        devices.extend(display_devices)
         
+        # Entries not seen in this pass are dropped
+        self._device_cache = next_cache
+        return devices
+
+    def _run_query_job(self, job: Callable[[Any], Any], next_cache: Dict) -> Any:
+        """
+        Run one query job on a pool thread with that thread's WMI connection.
+        
+        Args:
+            job: Collector taking a WMI connection
+            next_cache: Device cache being built for the current enumeration
+            
+        Returns:
+            The collector's result, or None if no WMI connection was available
+        """
+        self._local.next_cache = next_cache
         try:
             c = self._get_wmi()
         except Exception as e:
             logger.error(f"Failed to get WMI connection: {e}")
-            return devices
+            return None
+        return job(c)
+
+    def _collect_pnp_devices(self, c: Any) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
+        """
+        Collect USB, HID, Bluetooth and Display devices from one PnP query.
         
-        # 1. USB Devices
+        Returns:
+            Tuple of (usb, hid, bluetooth, display) device lists
+        """
+        # PnP entities in a single round-trip, bucketed by prefix so each
+        # category keeps its original order
+        usb_entities, hid_entities, bt_entities, display_entities = [], [], [], []
         try:
-            usb_entities = c.query("SELECT * FROM Win32_PnPEntity WHERE DeviceID LIKE 'USB%'")
-            for item in usb_entities:
-                self._add_usb_device(devices, item)
+            pnp_entities = self._exec_forward_only(
+                c, _PNP_SELECT + " OR ".join(f"({cond})" for _, cond in _PNP_CONDITIONS)
+            )
+            for item in pnp_entities:
+                did = (item.DeviceID or "").upper()
+                service = (item.Service or "").upper()
+                if did.startswith("USB"):
+                    usb_entities.append(item)
+                if did.startswith("HID"):
+                    hid_entities.append(item)
+                if did.startswith("BTH") or service == "BTHUSB":
+                    bt_entities.append(item)
+                if did.startswith("DISPLAY") or service == "MONITOR":
+                    display_entities.append(item)
         except Exception as e:
-            logger.error(f"Failed to query USB devices: {e}")
+            # Query each category on its own, so a failure only loses that category
+            logger.warning(f"Combined PnP query failed, querying per category: {e}")
+            usb_entities, hid_entities, bt_entities, display_entities = [], [], [], []
+            buckets = (usb_entities, hid_entities, bt_entities, display_entities)
+            for (label, condition), bucket in zip(_PNP_CONDITIONS, buckets):
+                try:
+                    bucket.extend(self._exec_forward_only(c, _PNP_SELECT + condition))
+                except Exception as e:
+                    logger.error(f"Failed to query {label} devices: {e}")
+        
+        usb_devices, hid_devices, bt_devices, display_devices = [], [], [], []
+        
+        # Each _add_* call logs and skips an item it cannot parse
+        # 1. USB Devices
+        for item in usb_entities:
+            self._add_usb_device(usb_devices, item)
         
         # 2. HID Devices
-        try:
-            hid_entities = c.query("SELECT * FROM Win32_PnPEntity WHERE DeviceID LIKE 'HID%'")
-            for item in hid_entities:
-                self._add_hid_device(devices, item)
-        except Exception as e:
-            logger.error(f"Failed to query HID devices: {e}")
+        for item in hid_entities:
+            self._add_hid_device(hid_devices, item)
+        
+        # 5. Bluetooth Devices
+        for item in bt_entities:
+            self._add_bluetooth_device(bt_devices, item)
+        
+        # 6. Display Devices (HDMI/Monitor)
+        for item in display_entities:
+            self._add_display_device(display_devices, item)
+        
+        return usb_devices, hid_devices, bt_devices, display_devices
+
+    def _collect_network_devices(self, c: Any) -> List[Dict]:
+        """Collect physical network adapters."""
+        devices = []
         
         # 3. Network Adapters
         try:
-            net_adapters = c.Win32_NetworkAdapter(PhysicalAdapter=True)
+            net_adapters = self._exec_forward_only(
+                c,
+                "SELECT Name,Manufacturer,PNPDeviceID,AdapterType,NetConnectionStatus,ServiceName "
+                "FROM Win32_NetworkAdapter WHERE PhysicalAdapter=True"
+            )
             for item in net_adapters:
                 if item.Name:
                     self._add_network_device(devices, item)
         except Exception as e:
             logger.error(f"Failed to query network adapters: {e}")
         
+        return devices
+
+    def _collect_storage_devices(self, c: Any) -> List[Dict]:
+        """Collect disk drives along with their mounted drive letters."""
+        devices = []
+        
         # 4. Storage Devices
         try:
-            disks = c.Win32_DiskDrive()
+            drive_letters = self._build_drive_letter_map(c)
+            disks = self._exec_forward_only(
+                c,
+                "SELECT DeviceID,Model,Caption,Manufacturer,MediaType,InterfaceType,Status "
+                "FROM Win32_DiskDrive"
+            )
             for item in disks:
-                self._add_storage_device(devices, item)
+                self._add_storage_device(devices, item, drive_letters)
         except Exception as e:
             logger.error(f"Failed to query storage devices: {e}")
         
-        # 5. Bluetooth Devices
-        try:
-            bt_entities = c.query("SELECT * FROM Win32_PnPEntity WHERE DeviceID LIKE 'BTH%' OR Service='BTHUSB'")
-            for item in bt_entities:
-                self._add_bluetooth_device(devices, item)
-        except Exception as e:
-            logger.error(f"Failed to query Bluetooth devices: {e}")
+        return devices
+
+    def _exec_forward_only(self, c: Any, wql: str) -> Iterator[SimpleNamespace]:
+        """
+        Run a WQL query with a forward-only, semi-synchronous enumerator.
         
-        # 6. Display Devices (HDMI/Monitor)
-        try:
-            display_entities = c.query("SELECT * FROM Win32_PnPEntity WHERE Service='monitor' OR DeviceID LIKE 'DISPLAY%'")
-            for item in display_entities:
-                self._add_display_device(devices, item)
-        except Exception as e:
-            logger.error(f"Failed to query Display devices: {e}")
+        Each row's projected properties are read once through Properties_ into
+        a plain record, so later field accesses are ordinary attribute lookups
+        instead of COM calls.
         
-        return devices
+        Args:
+            c: SWbemServices connection
+            wql: WQL query string
+            
+        Yields:
+            One record per row with the queried properties as attributes
+        """
+        rows = c.ExecQuery(wql, "WQL", WBEM_FLAG_RETURN_IMMEDIATELY | WBEM_FLAG_FORWARD_ONLY)
+        for obj in rows:
+            yield SimpleNamespace(**{prop.Name: prop.Value for prop in obj.Properties_})
+
+    def _lookup_cached(self, key: Tuple, signature: Tuple) -> Optional[Dict[str, str]]:
+        """
+        Return the previously parsed device for key if its source fields are unchanged.
+        
+        Args:
+            key: Cache key (category tag, DeviceID)
+            signature: Tuple of the raw WMI fields the device was built from
+            
+        Returns:
+            Cached device dictionary, or None on a miss
+        """
+        entry = self._device_cache.get(key)
+        if entry is None or entry[0] != signature:
+            return None
+        self._local.next_cache[key] = entry
+        return entry[1]
+
+    def _store_cached(self, key: Tuple, signature: Tuple, device: Dict[str, str]) -> None:
+        """Remember a freshly parsed device for the next enumeration."""
+        self._local.next_cache[key] = (signature, device)
     
     def _add_usb_device(self, devices: List[Dict], item) -> None:
         """Add USB device to the devices list."""
         try:
-            vid, pid = self._parse_vid_pid(item.DeviceID)
-            path = item.DeviceID or "Unknown"
+            signature = _PNP_FIELDS(item)
+            device_id, raw_name, description, raw_manufacturer, status, service = signature
+            key = ("USB", device_id)
+            cached = self._lookup_cached(key, signature)
+            if cached is not None:
+                devices.append(cached)
+                return
+            
+            vid, pid = self._parse_vid_pid(device_id)
+            path = device_id or "Unknown"
             
             # Determine device type
             dev_type = "USB Device"
             category = "USB"
-            name = item.Name or item.Description or "Unknown USB Device"
-            manufacturer = item.Manufacturer or "Unknown"
+            name = raw_name or description or "Unknown USB Device"
+            manufacturer = _intern(raw_manufacturer or "Unknown")
             
-            name_lower = name.lower()
-            desc_lower = (item.Description or "").lower()
+            desc_lower = (description or "").lower()
+            blob = f"{name.lower()} {desc_lower}"
             
-            if "hub" in name_lower or "hub" in desc_lower:
-                dev_type = "USB Hub"
-                category = "USB Port"
-            elif "controller" in name_lower or "controller" in desc_lower:
-                dev_type = "USB Controller"
-                category = "USB Port"
-            elif "composite" in desc_lower:
-                dev_type = "USB Composite Device"
+            for keywords, match_name, label_type, label_category in _USB_TYPES:
+                text = blob if match_name else desc_lower
+                if any(k in text for k in keywords):
+                    dev_type, category = label_type, label_category
+                    break
             
             # Determine if virtual or physical
             port_type = self._is_virtual_device(name, path, manufacturer)
 
-            devices.append({
+            device = {
                 "name": name,
                 "category": category,
                 "type": dev_type,
@@ -201,32 +449,43 @@ class DeviceManager:
                 "vid": vid,
                 "pid": pid,
                 "manufacturer": manufacturer,
-                "status": item.Status or "Unknown",
+                "status": _intern(status or "Unknown"),
                 "path": path,
-                "driver": item.Service or "Unknown"
-            })
+                "driver": _intern(service or "Unknown")
+            }
+            self._store_cached(key, signature, device)
+            devices.append(device)
         except Exception as e:
             logger.warning(f"Failed to add USB device: {e}")
     
     def _add_hid_device(self, devices: List[Dict], item) -> None:
         """Add HID device to the devices list."""
         try:
-            vid, pid = self._parse_vid_pid(item.DeviceID)
-            name = item.Name or item.Description or "Unknown HID Device"
-            manufacturer = item.Manufacturer or "Unknown"
-            path = item.DeviceID or "Unknown"
+            signature = _PNP_FIELDS(item)
+            device_id, raw_name, description, raw_manufacturer, status, service = signature
+            key = ("HID", device_id)
+            cached = self._lookup_cached(key, signature)
+            if cached is not None:
+                devices.append(cached)
+                return
+            
+            vid, pid = self._parse_vid_pid(device_id)
+            name = raw_name or description or "Unknown HID Device"
+            manufacturer = _intern(raw_manufacturer or "Unknown")
+            path = device_id or "Unknown"
             
             # Categorize HID devices
             cat = "HID"
-            if "keyboard" in name.lower():
-                cat = "Keyboard"
-            elif "mouse" in name.lower():
-                cat = "Mouse"
+            name_lower = name.lower()
+            for keywords, label_category in _HID_CATEGORIES:
+                if any(k in name_lower for k in keywords):
+                    cat = label_category
+                    break
             
             # Determine if virtual or physical
             port_type = self._is_virtual_device(name, path, manufacturer)
             
-            devices.append({
+            device = {
                 "name": name,
                 "category": cat,
                 "type": "Human Interface Device",
@@ -234,35 +493,44 @@ class DeviceManager:
                 "vid": vid,
                 "pid": pid,
                 "manufacturer": manufacturer,
-                "status": item.Status or "Unknown",
+                "status": _intern(status or "Unknown"),
                 "path": path,
-                "driver": item.Service or "Unknown"
-            })
+                "driver": _intern(service or "Unknown")
+            }
+            self._store_cached(key, signature, device)
+            devices.append(device)
         except Exception as e:
             logger.warning(f"Failed to add HID device: {e}")
     
     def _add_network_device(self, devices: List[Dict], item) -> None:
         """Add network adapter to the devices list."""
         try:
-            status = "Connected" if item.NetConnectionStatus == 2 else "Disconnected"
-            name = item.Name
-            manufacturer = item.Manufacturer or "Unknown"
-            path = item.PNPDeviceID or "N/A"
+            signature = _NETWORK_FIELDS(item)
+            name, raw_manufacturer, pnp_device_id, adapter, connection_status, service = signature
+            key = ("Network", pnp_device_id)
+            cached = self._lookup_cached(key, signature)
+            if cached is not None:
+                devices.append(cached)
+                return
+            
+            status = "Connected" if connection_status == 2 else "Disconnected"
+            manufacturer = _intern(raw_manufacturer or "Unknown")
+            path = pnp_device_id or "N/A"
             
             # Determine category (Ethernet vs Wi-Fi vs Network)
             category = "Network"
-            adapter_type = item.AdapterType or "Network Adapter"
+            adapter_type = _intern(adapter or "Network Adapter")
             
             name_lower = name.lower()
-            if "ethernet" in name_lower or "gbe" in name_lower or "gigabit" in name_lower:
-                category = "Ethernet"
-            elif "wi-fi" in name_lower or "wireless" in name_lower or "802.11" in name_lower:
-                category = "Wi-Fi"
+            for keywords, label_category in _NETWORK_CATEGORIES:
+                if any(k in name_lower for k in keywords):
+                    category = label_category
+                    break
             
             # Determine if virtual or physical
             port_type = self._is_virtual_device(name, path, manufacturer)
             
-            devices.append({
+            device = {
                 "name": name,
                 "category": category,
                 "type": adapter_type,
@@ -272,32 +540,60 @@ class DeviceManager:
                 "manufacturer": manufacturer,
                 "status": status,
                 "path": path,
-                "driver": item.ServiceName or "Unknown"
-            })
+                "driver": _intern(service or "Unknown")
+            }
+            self._store_cached(key, signature, device)
+            devices.append(device)
         except Exception as e:
             logger.warning(f"Failed to add network device: {e}")
     
-    def _add_storage_device(self, devices: List[Dict], item) -> None:
+    def _build_drive_letter_map(self, c: Any) -> Dict[str, str]:
+        """
+        Map each disk drive DeviceID to its first mounted drive letter.
+        
+        Both association classes are fetched in one query each instead of
+        walking associators() per disk and per partition.
+        
+        Args:
+            c: SWbemServices connection
+            
+        Returns:
+            Dictionary of upper-cased disk DeviceID -> drive letter (e.g. "E:")
+        """
+        drive_letters = {}
+        try:
+            partition_to_letter = {}
+            for assoc in self._exec_forward_only(
+                c, "SELECT Antecedent,Dependent FROM Win32_LogicalDiskToPartition"
+            ):
+                partition = _parse_wmi_ref_id(assoc.Antecedent)
+                letter = _parse_wmi_ref_id(assoc.Dependent)
+                if partition and letter:
+                    partition_to_letter.setdefault(partition, letter)
+            
+            for assoc in self._exec_forward_only(
+                c, "SELECT Antecedent,Dependent FROM Win32_DiskDriveToDiskPartition"
+            ):
+                disk = _parse_wmi_ref_id(assoc.Antecedent)
+                letter = partition_to_letter.get(_parse_wmi_ref_id(assoc.Dependent))
+                if disk and letter:
+                    drive_letters.setdefault(disk.upper(), letter)
+        except Exception as e:
+            logger.warning(f"Failed to map disk partitions to drive letters: {e}")
+        return drive_letters
+
+    def _add_storage_device(self, devices: List[Dict], item, drive_letters: Dict[str, str]) -> None:
         """Add storage device to the devices list."""
         try:
-            name = item.Model or item.Caption or "Unknown Storage"
-            manufacturer = item.Manufacturer or "Generic"
-            path = item.DeviceID or "Unknown"
-            media_type = item.MediaType or "Disk Drive"
-            interface_type = item.InterfaceType or "Unknown"
+            device_id, model, caption, raw_manufacturer, raw_media_type, raw_interface_type, status = _STORAGE_FIELDS(item)
+            name = model or caption or "Unknown Storage"
+            manufacturer = _intern(raw_manufacturer or "Generic")
+            path = device_id or "Unknown"
+            media_type = _intern(raw_media_type or "Disk Drive")
+            interface_type = _intern(raw_interface_type or "Unknown")
             
-            # Use WMI associations to find the drive letter (e.g., E:)
-            drive_letter = "N/A"
-            try:
-                for partition in item.associators("Win32_DiskDriveToDiskPartition"):
-                    for logical_disk in partition.associators("Win32_LogicalDiskToPartition"):
-                        if logical_disk.DeviceID:
-                            drive_letter = logical_disk.DeviceID
-                            break
-                    if drive_letter != "N/A":
-                        break
-            except Exception as e:
-                logger.warning(f"Failed to find mount point for {path}: {e}")
+            # Drive letter (e.g., E:) from the pre-built association map
+            drive_letter = drive_letters.get(path.upper(), "N/A")
 
             # Fallback: query Win32_LogicalDisk for removable drives if association failed
             if drive_letter == "N/A" and interface_type.upper() == "USB":
@@ -324,7 +620,7 @@ class DeviceManager:
                 "vid": "N/A",
                 "pid": "N/A",
                 "manufacturer": manufacturer,
-                "status": item.Status or "Unknown",
+                "status": _intern(status or "Unknown"),
                 "path": path,
                 "driver": "disk",
                 "mount_point": drive_letter
@@ -340,7 +636,7 @@ class DeviceManager:
         try:
             c = self._get_wmi()
             # DriveType 2 = Removable disk (USB pen drives)
-            for disk in c.Win32_LogicalDisk(DriveType=2):
+            for disk in self._exec_forward_only(c, "SELECT DeviceID FROM Win32_LogicalDisk WHERE DriveType=2"):
                 if disk.DeviceID:
                     return disk.DeviceID
         except Exception as e:
@@ -350,14 +646,22 @@ class DeviceManager:
     def _add_bluetooth_device(self, devices: List[Dict], item) -> None:
         """Add Bluetooth device to the devices list."""
         try:
-            name = item.Name or "Bluetooth Device"
-            manufacturer = item.Manufacturer or "Unknown"
-            path = item.DeviceID or "Unknown"
+            signature = _PNP_FIELDS(item)
+            device_id, raw_name, description, raw_manufacturer, status, service = signature
+            key = ("Bluetooth", device_id)
+            cached = self._lookup_cached(key, signature)
+            if cached is not None:
+                devices.append(cached)
+                return
+            
+            name = raw_name or "Bluetooth Device"
+            manufacturer = _intern(raw_manufacturer or "Unknown")
+            path = device_id or "Unknown"
             
             # Determine if virtual or physical
             port_type = self._is_virtual_device(name, path, manufacturer)
             
-            devices.append({
+            device = {
                 "name": name,
                 "category": "Bluetooth",
                 "type": "Bluetooth",
@@ -365,29 +669,39 @@ class DeviceManager:
                 "vid": "N/A",
                 "pid": "N/A",
                 "manufacturer": manufacturer,
-                "status": item.Status or "Unknown",
+                "status": _intern(status or "Unknown"),
                 "path": path,
-                "driver": item.Service or "Unknown"
-            })
+                "driver": _intern(service or "Unknown")
+            }
+            self._store_cached(key, signature, device)
+            devices.append(device)
         except Exception as e:
             logger.warning(f"Failed to add Bluetooth device: {e}")
 
     def _add_display_device(self, devices: List[Dict], item) -> None:
         """Add Display/Monitor device to the devices list."""
         try:
-            name = item.Name or item.Description or "Generic Monitor"
-            manufacturer = item.Manufacturer or "Unknown"
-            path = item.DeviceID or "Unknown"
+            signature = _PNP_FIELDS(item)
+            device_id, raw_name, description, raw_manufacturer, status, service = signature
+            key = ("Display", device_id)
+            cached = self._lookup_cached(key, signature)
+            if cached is not None:
+                devices.append(cached)
+                return
+            
+            name = raw_name or description or "Generic Monitor"
+            manufacturer = _intern(raw_manufacturer or "Unknown")
+            path = device_id or "Unknown"
             
             # Check for HDMI in name/description (not always reliable, but helps categorization)
             category = "Display"
-            if "hdmi" in name.lower() or "hdmi" in (item.Description or "").lower():
+            if "hdmi" in f"{name} {description or ''}".lower():
                 category = "HDMI"
             
             # Determine if virtual or physical
             port_type = self._is_virtual_device(name, path, manufacturer)
             
-            devices.append({
+            device = {
                 "name": name,
                 "category": category,
                 "type": "Display Monitor",
@@ -395,9 +709,11 @@ class DeviceManager:
                 "vid": "N/A",
                 "pid": "N/A",
                 "manufacturer": manufacturer,
-                "status": item.Status or "Unknown",
+                "status": _intern(status or "Unknown"),
                 "path": path,
-                "driver": item.Service or "Unknown"
-            })
+                "driver": _intern(service or "Unknown")
+            }
+            self._store_cached(key, signature, device)
+            devices.append(device)
         except Exception as e:
             logger.warning(f"Failed to add Display device: {e}")
@@ -5,8 +5,14 @@ Provides a sleek dark-themed interface with enhanced visuals.
 import customtkinter as ctk
 from tkinter import ttk, messagebox, filedialog
 import threading
-from typing import Dict, Optional, List, Any, Union
+import itertools
+import queue
+import time
+from collections import defaultdict
+from typing import Dict, Optional, List, Any, Union, Tuple
 import datetime
+import functools
+import os
 from src.device_manager import DeviceManager
 from src.user_profile import UserProfile
 from src.system_activity_log import ActivityLog, ActivityType
@@ -18,9 +24,124 @@ from src.hardware_port_sandbox import HardwarePortSandbox
 ctk.set_appearance_mode("Dark")
 ctk.set_default_color_theme("blue")
 
+# Device status icons shown in the tree rows
+_ICON_OK = "✅"
+_ICON_BAD = "❌"
+_ICON_WARN = "⚠️"
+_OK_WORDS = ("ok", "connected")
+_BAD_WORDS = ("disconnected", "error")
+
+
+# Device statuses are few and repeat every scan; the bound only guards against
+# a source that reports free-form status text
+@functools.lru_cache(maxsize=64)
+def _status_icon(status: Any) -> str:
+    """Return the tree icon for a device status, classifying each distinct status once."""
+    status_str = str(status).lower()
+    if any(word in status_str for word in _OK_WORDS):
+        return _ICON_OK
+    if any(word in status_str for word in _BAD_WORDS):
+        return _ICON_BAD
+    return _ICON_WARN
+
+
+# Longest device name shown in a tree row; Treeview measures the full text
+_MAX_ROW_NAME = 120
+
+
+def _row_texts_key(d: Dict) -> tuple:
+    """Return the device fields its search key and row text are derived from."""
+    return (d['name'], d.get('manufacturer', ''), d['category'], d['status'])
+
+
+def _derive_row_texts(d: Dict) -> tuple:
+    """Return a device's casefolded search key and its tree row text."""
+    return (
+        f"{d['name']}\x00{d.get('manufacturer', '')}\x00{d['category']}".casefold(),
+        f"{_status_icon(d['status'])} {d['name'].strip()[:_MAX_ROW_NAME]}"
+    )
+
+# Tcl lambda inserting flat (parent, iid, text, open) rows into a Treeview in one
+# call; the rows travel as a Tcl list, so device names need no quoting
+_TREE_INSERT_LAMBDA = (
+    "{w rows} {foreach {parent id text open} $rows "
+    "{$w insert $parent end -id $id -text $text -open $open}}"
+)
+
+# Device detail panel: (field label, device dict key)
+_DETAIL_FIELDS = (
+    ("Name", "name"),
+    ("Category", "category"),
+    ("Type", "type"),
+    ("Port Type", "port_type"),
+    ("Status", "status"),
+    ("Manufacturer", "manufacturer"),
+    ("VID", "vid"),
+    ("PID", "pid"),
+    ("Driver", "driver"),
+    ("Path", "path")
+)
+
+# Device category -> dashboard stat card it counts toward
+_STAT_CARD_KEYS = {
+    "USB": "usb",
+    "HID": "hid",
+    "Keyboard": "hid",
+    "Mouse": "hid",
+    "Network": "network"
+}
+
+# Detail fields shown for every selected device; the rest only appear when the
+# device has a value for them. All are created on first use.
+_CORE_DETAIL_FIELDS = ("Name", "Category", "Status")
+
+# Tree category icons, in the order the categories are listed; categories not
+# named here follow alphabetically
+_CATEGORY_ICONS = {
+    "USB": "🔌",
+    "USB Port": "🔌",
+    "USB Storage": "💿",
+    "HID": "⌨️",
+    "Keyboard": "⌨️",
+    "Mouse": "🖱️",
+    "Network": "🌐",
+    "Ethernet": "🔗",
+    "Wi-Fi": "📶",
+    "Storage": "💾",
+    "Bluetooth": "📡",
+    "Display": "🖥️",
+    "HDMI": "🖥️"
+}
+
+# Activity log row colours by severity, and icons by activity type
+_SEVERITY_COLORS = {
+    "error": Theme.ERROR,
+    "warning": Theme.WARNING,
+    "success": Theme.SUCCESS,
+    "info": Theme.PRIMARY
+}
+
+_ACTIVITY_TYPE_ICONS = {
+    "device_connected": "🟢",
+    "device_disconnected": "🔴",
+    "device_error": "⚠️",
+    "system_startup": "🚀",
+    "system_shutdown": "⏹️",
+    "profile_updated": "👤",
+    "settings_changed": "⚙️",
+    "refresh_triggered": "🔄"
+}
+
 
 class DashboardApp(ctk.CTk):
     """Main application class for Device Monitor Pro with CustomTkinter."""
+
+    REFRESH_INTERVAL_MS = 5000
+    UNFOCUSED_REFRESH_INTERVAL_MS = 15000  # While another application has focus
+    HIDDEN_REFRESH_INTERVAL_MS = 30000  # While minimized or not viewable
+    SEARCH_DEBOUNCE_MS = 250  # Typing pause before the tree is re-filtered
+    SLOW_SCAN_SECONDS = 2.0  # Scans slower than this double the refresh interval
+    RESULT_POLL_MS = 50  # How often _pump_results checks on a running scan
     
     def __init__(self) -> None:
         """Initialize the modern dashboard application."""
@@ -40,25 +161,96 @@ class DashboardApp(ctk.CTk):
         self.current_view: Optional[str] = None
         self.is_refreshing = False
         self.last_update_time: Optional[datetime.datetime] = None
+        self._last_update_str = ""  # last_update_time as HH:MM:SS, formatted by the worker
+        # Unfiltered result of the latest scan and its signature, replaced as one
+        # pair by the scan worker so the two never disagree
+        self._last_scan: Tuple[List[Dict], tuple] = ([], ())
+        self._search_after_id: Optional[str] = None
+        self._view_cache: Dict[str, ctk.CTkFrame] = {}  # Views kept alive across switches
+        # Counts shown on the dashboard stat cards; -1 until first written
+        self._last_counts: Dict[str, int] = {'total': -1, 'usb': -1, 'hid': -1, 'network': -1}
+        self._last_sig: Optional[tuple] = None  # Device signature of the last tree sync
+        self._last_query = ""
+        self._last_tree_counts = (0, 0)
+        self._refresh_after_id: Optional[str] = None
+        self._refresh_backed_off = False
+        self._refresh_interval_ms = self.REFRESH_INTERVAL_MS  # Grows while scans are slow
+        self._previous_device_paths: set = set()
+        # _row_texts_key(device) -> (search key, row text) for the latest scan
+        self._row_texts: Dict[tuple, tuple] = {}
+        self._drives_pending = False  # Refill the drive dropdown when the next scan lands
+
+        # Dashboard widgets; built once by _build_dashboard and kept with the cached view
+        self.tree_physical: Optional[ttk.Treeview] = None
+        self.tree_virtual: Optional[ttk.Treeview] = None
+        self.search_entry: Optional[ctk.CTkEntry] = None
+        self.refresh_btn: Optional[ctk.CTkButton] = None
+        self.lbl_status: Optional[ctk.CTkLabel] = None
+        self.stats_cards: Optional[Dict[str, ctk.CTkLabel]] = None
+        self.detail_vars: Optional[Dict[str, ctk.StringVar]] = None
+        self._current_detail_text = ""  # Clipboard text for the selected device
+        self._last_detail_values: Dict[str, Any] = {}  # Values held by detail_vars
+        self._detail_iid: Optional[str] = None  # Tree row whose device the panel shows
+        self._detail_device: Optional[Dict] = None
+        self._detail_fields_frame: Optional[ctk.CTkFrame] = None
+        self._detail_widgets: Dict[str, tuple] = {}  # field label -> (caption, entry)
+        self._hidden_detail_fields: set = set()
+        self._row_ids = itertools.count(1)  # Device row iids, see _populate_tree
+
+        # Activity log rows, reused across reloads; see _load_activities
+        self._activity_rows: List[Dict[str, Any]] = []
+        self._activity_rows_shown = 0
+        self._activity_empty_label: Optional[ctk.CTkLabel] = None
+        # filter -> (activity_log.version, activities) for the filters already shown
+        self._activity_cache: Dict[str, tuple] = {}
 
         # Grid Configuration
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
+        self._configure_ttk_style()
         self._setup_layout()
         self._setup_keyboard_shortcuts()
         
+        # One long-lived scan thread; _refresh_data wakes it via the event
+        self._scan_event = threading.Event()
+        self._scan_results: queue.Queue = queue.Queue()  # (kind, payload) from the worker
+        threading.Thread(target=self._scan_worker, name="device-scan", daemon=True).start()
+        
         # Start Dashboard by default
         self.show_dashboard()
         
-        # Start background refresh loop
-        self._start_refresh_loop()
+        # Start background refresh loop; show_dashboard already ran the first scan,
+        # and the window isn't mapped yet so the loop would read it as hidden
+        self._refresh_after_id = self.after(self.REFRESH_INTERVAL_MS, self._start_refresh_loop)
     
+    def _configure_ttk_style(self) -> None:
+        """Configure the ttk.Treeview style once; the style database is global."""
+        # Dark theme with enhanced styling
+        style = ttk.Style()
+        style.theme_use('clam')
+        style.configure("Treeview",
+                       background="#2B2B2B",
+                       foreground=Theme.TEXT_MAIN,
+                       fieldbackground="#2B2B2B",
+                       borderwidth=0,
+                       rowheight=35,
+                       font=(Theme.FONT_FAMILY, 11))
+        style.map('Treeview', 
+                 background=[('selected', Theme.PRIMARY)],
+                 foreground=[('selected', 'white')])
+        style.configure("Treeview.Heading",
+                       background="#1F1F1F",
+                       foreground=Theme.PRIMARY,
+                       borderwidth=0,
+                       font=(Theme.FONT_FAMILY, 11, 'bold'))
+
     def _setup_keyboard_shortcuts(self) -> None:
         """Setup keyboard shortcuts for better UX."""
         self.bind('<F5>', lambda e: self._manual_refresh())
         self.bind('<Control-f>', lambda e: self._focus_search())
-        self.bind('<Escape>', lambda e: self.search_entry.delete(0, 'end') if hasattr(self, 'search_entry') else None)
+        self.bind('<Escape>', lambda e: self._clear_search())
+        self.bind('<FocusIn>', lambda e: self._on_focus_in())
 
     def _setup_layout(self) -> None:
         """Setup the main layout with sidebar and content area."""
@@ -82,9 +274,29 @@ class DashboardApp(ctk.CTk):
         self.main_container.grid_columnconfigure(0, weight=1)
 
     def _clear_content(self) -> None:
-        """Clear the main content area."""
+        """Clear the main content area, hiding cached views instead of destroying them."""
+        cached = list(self._view_cache.values())
         for widget in self.main_container.winfo_children():
-            widget.destroy()
+            if widget in cached:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+
+    def _show_cached_view(self, name: str, build) -> bool:
+        """Show the cached frame for a view, building it on first use.
+
+        Returns True if the view was built by this call.
+        """
+        self._clear_content()
+        self.current_view = name
+
+        view = self._view_cache.get(name)
+        built = view is None
+        if built:
+            view = self._view_cache[name] = ctk.CTkFrame(self.main_container, fg_color="transparent")
+            build(view)
+        view.pack(fill="both", expand=True)
+        return built
 
     # ========================== VIEWS ==========================
     
@@ -93,8 +305,7 @@ class DashboardApp(ctk.CTk):
         if self.current_view == "dashboard":
             return
             
-        self._clear_content()
-        self.current_view = "dashboard"
+        built = self._show_cached_view("dashboard", self._build_dashboard)
         
         # Update button states with enhanced visual feedback
         if hasattr(self, 'sidebar') and isinstance(self.sidebar, NavigationSidebar):
@@ -102,9 +313,21 @@ class DashboardApp(ctk.CTk):
         
         # Log activity
         self.activity_log.log_activity(ActivityType.REFRESH_TRIGGERED, "Dashboard refreshed", "System")
-        
+
+        # A freshly built tree shows the last scan right away instead of starting empty
+        if built and self._last_scan[0]:
+            self._update_tree(*self._last_scan)
+
+        # Initial load, or catch up on changes made while another view was shown;
+        # deferred so the dashboard paints before the scan starts
+        self.after_idle(self._refresh_data)
+
+    def _build_dashboard(self, view) -> None:
+        """Build the dashboard widgets once; later visits reuse them."""
+        view.grid_columnconfigure(0, weight=1)
+
         # 1. Statistics Cards Row
-        self.stats_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        self.stats_frame = ctk.CTkFrame(view, fg_color="transparent")
         self.stats_frame.grid(row=0, column=0, sticky="ew", pady=(0, 20))
         
         self.stats_cards = {
@@ -115,7 +338,7 @@ class DashboardApp(ctk.CTk):
         }
 
         # 2. Action Bar (Search + Refresh)
-        self.action_bar = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        self.action_bar = ctk.CTkFrame(view, fg_color="transparent")
         self.action_bar.grid(row=1, column=0, sticky="ew", pady=(0, 15))
         
         # Search container with icon
@@ -127,12 +350,13 @@ class DashboardApp(ctk.CTk):
             placeholder_text="🔍 Search devices by name, category, or manufacturer...",
             width=450,
             height=40,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=13),
             corner_radius=10,
             border_width=2
         )
         self.search_entry.pack(side="left")
         self.search_entry.bind("<KeyRelease>", lambda e: self._on_search_changed())
+        self.search_entry.bind("<Return>", lambda e: self._submit_search())
         
         # Status with icon
         status_frame = ctk.CTkFrame(self.action_bar, fg_color="transparent")
@@ -144,7 +368,7 @@ class DashboardApp(ctk.CTk):
             command=self._manual_refresh,
             width=130,
             height=40,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=13, weight="bold"),
             corner_radius=10,
             fg_color=(Theme.SUCCESS, Theme.SUCCESS_Hover),
             hover_color=("#1E8449", "#196F3D")
@@ -154,15 +378,15 @@ class DashboardApp(ctk.CTk):
         self.lbl_status = ctk.CTkLabel(
             status_frame,
             text="⚡ Ready",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=12, weight="bold"),
             text_color=(Theme.PRIMARY, "#5CA8E0")
         )
         self.lbl_status.pack(side="right", padx=15)
 
         # 3. Content Body (Tabbed Tree + Details)
-        self.body_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
+        self.body_frame = ctk.CTkFrame(view, fg_color="transparent")
         self.body_frame.grid(row=2, column=0, sticky="nsew")
-        self.main_container.grid_rowconfigure(2, weight=1)
+        view.grid_rowconfigure(2, weight=1)
         self.body_frame.grid_columnconfigure(0, weight=3) # Increased weight for tree
         self.body_frame.grid_columnconfigure(1, weight=1)
 
@@ -189,25 +413,6 @@ class DashboardApp(ctk.CTk):
         self.device_tabview.add("🔌 Physical Devices")
         self.device_tabview.add("💻 Virtual Devices")
         
-        # Configure ttk.Treeview style for dark theme with enhanced styling
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure("Treeview",
-                       background="#2B2B2B",
-                       foreground=Theme.TEXT_MAIN,
-                       fieldbackground="#2B2B2B",
-                       borderwidth=0,
-                       rowheight=35,
-                       font=(Theme.FONT_FAMILY, 11))
-        style.map('Treeview', 
-                 background=[('selected', Theme.PRIMARY)],
-                 foreground=[('selected', 'white')])
-        style.configure("Treeview.Heading",
-                       background="#1F1F1F",
-                       foreground=Theme.PRIMARY,
-                       borderwidth=0,
-                       font=(Theme.FONT_FAMILY, 11, 'bold'))
-        
         # Create Treeview for Physical Devices
         physical_container = ctk.CTkFrame(
             self.device_tabview.tab("🔌 Physical Devices"),
@@ -240,6 +445,7 @@ class DashboardApp(ctk.CTk):
         
         # Keep reference to active tree (for backward compatibility)
         self.tree = self.tree_physical
+        self._tree_index = {}  # tree -> row/category key -> (iid, text), see _populate_tree
 
         # Details Panel
         self.details_frame = ctk.CTkScrollableFrame(
@@ -262,13 +468,13 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             header_content,
             text="📋",
-            font=ctk.CTkFont(size=20)
+            font=Theme.font(size=20)
         ).pack(side="left", padx=(0, 8))
         
         ctk.CTkLabel(
             header_content,
             text="Device Details",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=Theme.font(size=18, weight="bold"),
             text_color=("#F39C12", "#D68910")
         ).pack(side="left")
         
@@ -279,7 +485,7 @@ class DashboardApp(ctk.CTk):
             width=100,
             height=35,
             state="disabled",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=Theme.font(size=12, weight="bold"),
             corner_radius=8,
             fg_color=("#3B8ED0", "#1F6AA5"),
             hover_color=("#2E77B5", "#1A5687")
@@ -287,27 +493,16 @@ class DashboardApp(ctk.CTk):
         self.btn_copy.pack(side="right")
         
         # Details Fields
-        self.detail_vars = {
-            "Name": ctk.StringVar(),
-            "Category": ctk.StringVar(),
-            "Type": ctk.StringVar(),
-            "Port Type": ctk.StringVar(),
-            "Status": ctk.StringVar(),
-            "Manufacturer": ctk.StringVar(),
-            "VID": ctk.StringVar(),
-            "PID": ctk.StringVar(),
-            "Driver": ctk.StringVar(),
-            "Path": ctk.StringVar()
-        }
+        self.detail_vars = {label: ctk.StringVar() for label, _ in _DETAIL_FIELDS}
         
-        for label_text, var in self.detail_vars.items():
-            self._create_detail_field(self.details_frame, label_text, var)
-
-        # Initial Load
-        self._refresh_data()
+        # One grid holds every field, rather than a frame stack per field
+        self._detail_fields_frame = ctk.CTkFrame(self.details_frame, fg_color="transparent")
+        self._detail_fields_frame.pack(fill="x", padx=15)
+        self._detail_fields_frame.grid_columnconfigure(0, weight=1)
+        # The field rows themselves are created by the first selection
 
-    def _create_stat_card(self, parent, title, value, icon, col, accent_color=Theme.PRIMARY) -> ctk.StringVar:
-        """Create a statistics card widget with enhanced styling."""
+    def _create_stat_card(self, parent, title, value, icon, col, accent_color=Theme.PRIMARY) -> ctk.CTkLabel:
+        """Create a statistics card widget and return its value label."""
         card = ctk.CTkFrame(
             parent, 
             height=110,
@@ -332,33 +527,30 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             icon_frame,
             text=icon,
-            font=ctk.CTkFont(size=24)
+            font=Theme.font(size=24)
         ).pack(expand=True)
         
-        # Value label
-        value_var = ctk.StringVar(value=value)
-        ctk.CTkLabel(
+        # Value label; set with configure(text=...), which skips a StringVar trace
+        value_label = ctk.CTkLabel(
             card,
-            textvariable=value_var,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=28, weight="bold"),
+            text=value,
+            font=Theme.font(family=Theme.FONT_FAMILY, size=28, weight="bold"),
             text_color=(accent_color, accent_color)
-        ).pack(pady=2)
+        )
+        value_label.pack(pady=2)
         
         # Title label
         ctk.CTkLabel(
             card,
             text=title,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=11, weight="bold"),
             text_color="gray"
         ).pack(pady=(2, 12))
         
-        return value_var
+        return value_label
 
-    def _create_detail_field(self, parent, label, variable) -> None:
-        """Create a detail field row with enhanced styling."""
-        row = ctk.CTkFrame(parent, fg_color="transparent")
-        row.pack(fill="x", padx=15, pady=6)
-        
+    def _create_detail_field(self, parent, label, variable, row) -> tuple:
+        """Create a detail field (caption above a read-only entry) in grid row pair `row`."""
         # Label with icon based on field type
         label_icons = {
             "Name": "📝",
@@ -373,45 +565,69 @@ class DashboardApp(ctk.CTk):
             "Path": "📍"
         }
         
-        label_frame = ctk.CTkFrame(row, fg_color="transparent")
-        label_frame.pack(anchor="w", pady=(0, 3))
-        
         icon = label_icons.get(label, "•")
-        ctk.CTkLabel(
-            label_frame,
+        caption = ctk.CTkLabel(
+            parent,
             text=f"{icon} {label.upper()}",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=10, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=10, weight="bold"),
             text_color=(Theme.PRIMARY, "#5CA8E0"),
             anchor="w"
-        ).pack(side="left")
+        )
+        caption.grid(row=2 * row, column=0, sticky="w", pady=(6, 3))
         
         entry = ctk.CTkEntry(
-            row,
+            parent,
             textvariable=variable,
             state="readonly",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=12),
             height=35,
             corner_radius=8,
             border_width=1
         )
-        entry.pack(fill="x", pady=(2, 0))
+        entry.grid(row=2 * row + 1, column=0, sticky="ew", pady=(2, 6))
+        return caption, entry
+
+    def _set_detail_field_visible(self, label, row, visible) -> None:
+        """Show or hide a detail field, creating it the first time it is shown."""
+        widgets = self._detail_widgets.get(label)
+        if widgets is None:
+            if visible:
+                self._detail_widgets[label] = self._create_detail_field(
+                    self._detail_fields_frame, label, self.detail_vars[label], row)
+            return
+        
+        # grid_remove keeps the widgets and their grid options for the next device
+        if visible and label in self._hidden_detail_fields:
+            for widget in widgets:
+                widget.grid()
+            self._hidden_detail_fields.discard(label)
+        elif not visible and label not in self._hidden_detail_fields:
+            for widget in widgets:
+                widget.grid_remove()
+            self._hidden_detail_fields.add(label)
 
     def show_profile(self) -> None:
         """Display the user profile management view with security credentials."""
         if self.current_view == "profile":
             return
             
-        self._clear_content()
-        self.current_view = "profile"
+        if not self._show_cached_view("profile", self._build_profile):
+            self._sync_profile_view()
         
         # Update button states
         if hasattr(self, 'sidebar') and isinstance(self.sidebar, NavigationSidebar):
             self.sidebar.update_selection("profile")
-        
-        # Main container with padding
-        main_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True)
-        
+
+    def _sync_profile_view(self) -> None:
+        """Reload a cached profile view from the saved profile, dropping unsaved edits."""
+        self.lbl_profile_name.configure(text=self.user_profile.name)
+        self.var_name.set(self.user_profile.name)
+        self.var_email.set(self.user_profile.email)
+        self.var_password.set(self.user_profile.password)
+        self.var_password_hash.set(self.user_profile.get_password_hash())
+
+    def _build_profile(self, main_frame) -> None:
+        """Build the profile widgets once; later visits reuse them."""
         # Header Section
         header_frame = ctk.CTkFrame(main_frame, fg_color=Theme.SECONDARY, height=120)
         header_frame.pack(fill="x", padx=0, pady=(0, 20))
@@ -425,7 +641,7 @@ class DashboardApp(ctk.CTk):
         avatar = ctk.CTkLabel(
             header_content,
             text="👤",
-            font=ctk.CTkFont(size=40),
+            font=Theme.font(size=40),
             width=80,
             height=80,
             fg_color=[Theme.PRIMARY, "#1F6AA5"],
@@ -437,17 +653,18 @@ class DashboardApp(ctk.CTk):
         name_frame = ctk.CTkFrame(header_content, fg_color="transparent")
         name_frame.pack(side="left")
         
-        ctk.CTkLabel(
+        self.lbl_profile_name = ctk.CTkLabel(
             name_frame,
             text=self.user_profile.name,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=24, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=24, weight="bold"),
             text_color="white"
-        ).pack(anchor="w")
+        )
+        self.lbl_profile_name.pack(anchor="w")
         
         ctk.CTkLabel(
             name_frame,
             text=self.user_profile.role,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=12),
             text_color=[Theme.PRIMARY, "#1F6AA5"]
         ).pack(anchor="w")
         
@@ -468,13 +685,13 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             left_header,
             text="👤",
-            font=ctk.CTkFont(size=16)
+            font=Theme.font(size=16)
         ).pack(side="left", padx=(0, 10))
         
         ctk.CTkLabel(
             left_header,
             text="Personal Information",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14, weight="bold")
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14, weight="bold")
         ).pack(side="left")
         
         # Personal Info Fields
@@ -497,13 +714,13 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             right_header,
             text="🔒",
-            font=ctk.CTkFont(size=16)
+            font=Theme.font(size=16)
         ).pack(side="left", padx=(0, 10))
         
         ctk.CTkLabel(
             right_header,
             text="Security Credentials",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=Theme.font(size=14, weight="bold")
         ).pack(side="left")
         
         # Security Fields
@@ -522,7 +739,7 @@ class DashboardApp(ctk.CTk):
             text="💾 Save Changes",
             command=self._save_profile,
             height=45,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=Theme.font(size=14, weight="bold"),
             fg_color="#27AE60",
             hover_color="#229954"
         )
@@ -537,7 +754,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             container,
             text=label,
-            font=ctk.CTkFont(size=9, weight="bold"),
+            font=Theme.font(size=9, weight="bold"),
             text_color="gray",
             anchor="w"
         ).pack(anchor="w", pady=(0, 5))
@@ -551,14 +768,14 @@ class DashboardApp(ctk.CTk):
             ctk.CTkLabel(
                 entry_frame,
                 text=icon,
-                font=ctk.CTkFont(size=14),
+                font=Theme.font(size=14),
                 width=30
             ).pack(side="left", padx=(10, 5))
         
         entry = ctk.CTkEntry(
             entry_frame,
             textvariable=variable,
-            font=ctk.CTkFont(size=12),
+            font=Theme.font(size=12),
             border_width=0,
             fg_color="transparent",
             state="readonly" if readonly else "normal"
@@ -574,7 +791,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             container,
             text=label,
-            font=ctk.CTkFont(size=9, weight="bold"),
+            font=Theme.font(size=9, weight="bold"),
             text_color="gray",
             anchor="w"
         ).pack(anchor="w", pady=(0, 5))
@@ -588,7 +805,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             entry_frame,
             text="🔒",
-            font=ctk.CTkFont(size=14),
+            font=Theme.font(size=14),
             width=30
         ).pack(side="left", padx=(10, 5))
         
@@ -596,7 +813,7 @@ class DashboardApp(ctk.CTk):
         self.password_entry = ctk.CTkEntry(
             entry_frame,
             textvariable=variable,
-            font=ctk.CTkFont(size=12),
+            font=Theme.font(size=12),
             border_width=0,
             fg_color="transparent",
             show="●"
@@ -624,7 +841,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             container,
             text=label,
-            font=ctk.CTkFont(size=9, weight="bold"),
+            font=Theme.font(size=9, weight="bold"),
             text_color="gray",
             anchor="w"
         ).pack(anchor="w", pady=(0, 5))
@@ -638,7 +855,7 @@ class DashboardApp(ctk.CTk):
         badge = ctk.CTkLabel(
             entry_frame,
             text="SHA-256",
-            font=ctk.CTkFont(size=8, weight="bold"),
+            font=Theme.font(size=8, weight="bold"),
             text_color="white",
             fg_color=["#3B8ED0", "#1F6AA5"],
             corner_radius=3,
@@ -648,16 +865,20 @@ class DashboardApp(ctk.CTk):
         badge.pack(side="left", padx=10)
         
         # Hash Display (truncated)
-        hash_value = variable.get()
-        display_hash = hash_value[:30] + "..." if len(hash_value) > 30 else hash_value
+        def display_hash() -> str:
+            hash_value = variable.get()
+            return hash_value[:30] + "..." if len(hash_value) > 30 else hash_value
         
-        ctk.CTkLabel(
+        hash_label = ctk.CTkLabel(
             entry_frame,
-            text=display_hash,
-            font=ctk.CTkFont(size=10, family="Consolas"),
+            text=display_hash(),
+            font=Theme.font(size=10, family="Consolas"),
             text_color="gray",
             anchor="w"
-        ).pack(side="left", fill="both", expand=True, padx=5)
+        )
+        hash_label.pack(side="left", fill="both", expand=True, padx=5)
+        # The profile view is cached, so follow later hash updates
+        variable.trace_add("write", lambda *_: hash_label.configure(text=display_hash()))
     
     def _toggle_password_visibility(self):
         """Toggle password visibility."""
@@ -677,7 +898,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             container,
             text=label,
-            font=ctk.CTkFont(size=12),
+            font=Theme.font(size=12),
             text_color="gray",
             anchor="w"
         ).pack(anchor="w")
@@ -686,7 +907,7 @@ class DashboardApp(ctk.CTk):
             container,
             textvariable=variable,
             height=40,
-            font=ctk.CTkFont(size=13)
+            font=Theme.font(size=13)
         ).pack(fill="x", pady=(5, 0))
 
     def _save_profile(self):
@@ -694,10 +915,11 @@ class DashboardApp(ctk.CTk):
         try:
             self.user_profile.name = self.var_name.get()
             self.user_profile.email = self.var_email.get()
-            self.user_profile.password = self.var_password.get()
             
-            # Update hash display
-            self.var_password_hash.set(self.user_profile.get_password_hash())
+            # Update hash display only when the password actually changed
+            if self.var_password.get() != self.user_profile.password:
+                self.user_profile.password = self.var_password.get()
+                self.var_password_hash.set(self.user_profile.get_password_hash())
             
             self.user_profile.save()
             
@@ -717,17 +939,17 @@ class DashboardApp(ctk.CTk):
         if self.current_view == "activity_log":
             return
         
-        self._clear_content()
-        self.current_view = "activity_log"
+        if not self._show_cached_view("activity_log", self._build_activity_log):
+            # Entries were logged while another view was shown
+            self._update_activity_stats()
+            self._load_activities(self.filter_var.get())
         
         # Update button states
         if hasattr(self, 'sidebar') and isinstance(self.sidebar, NavigationSidebar):
             self.sidebar.update_selection("activity_log")
-        
-        # Main container
-        main_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True)
-        
+
+    def _build_activity_log(self, main_frame) -> None:
+        """Build the activity log widgets once; later visits reuse them."""
         # Header with Statistics
         header_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         header_frame.pack(fill="x", pady=(0, 15))
@@ -735,7 +957,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             header_frame,
             text="📋 System Activity Log",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=24, weight="bold")
+            font=Theme.font(family=Theme.FONT_FAMILY, size=24, weight="bold")
         ).pack(side="left")
         
         # Get statistics
@@ -746,13 +968,14 @@ class DashboardApp(ctk.CTk):
         stats_container.pack(side="right")
         
         stats_info = [
-            (f"{stats['today_activities']}", "Today", "📅"),
-            (f"{stats['devices_connected_today']}", "Connected", "🟢"),
-            (f"{stats['devices_disconnected_today']}", "Disconnected", "🔴"),
-            (f"{stats['total_activities']}", "Total", "📊")
+            ("today_activities", "Today", "📅"),
+            ("devices_connected_today", "Connected", "🟢"),
+            ("devices_disconnected_today", "Disconnected", "🔴"),
+            ("total_activities", "Total", "📊")
         ]
         
-        for idx, (value, label, icon) in enumerate(stats_info):
+        self._activity_stat_labels = {}
+        for idx, (key, label, icon) in enumerate(stats_info):
             card = ctk.CTkFrame(stats_container, width=100, height=60)
             card.pack(side="left", padx=5)
             card.pack_propagate(False)
@@ -760,19 +983,21 @@ class DashboardApp(ctk.CTk):
             ctk.CTkLabel(
                 card,
                 text=icon,
-                font=ctk.CTkFont(size=16)
+                font=Theme.font(size=16)
             ).pack(pady=(5, 0))
             
-            ctk.CTkLabel(
+            value_label = ctk.CTkLabel(
                 card,
-                text=value,
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=18, weight="bold")
-            ).pack()
+                text=f"{stats[key]}",
+                font=Theme.font(family=Theme.FONT_FAMILY, size=18, weight="bold")
+            )
+            value_label.pack()
+            self._activity_stat_labels[key] = value_label
             
             ctk.CTkLabel(
                 card,
                 text=label,
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=9),
+                font=Theme.font(family=Theme.FONT_FAMILY, size=9),
                 text_color="gray"
             ).pack(pady=(0, 5))
         
@@ -836,69 +1061,78 @@ class DashboardApp(ctk.CTk):
         # Load and display activities
         self._load_activities()
     
+    def _update_activity_stats(self) -> None:
+        """Refresh the activity log header counts."""
+        stats = self.activity_log.get_statistics()
+        for key, value_label in self._activity_stat_labels.items():
+            value_label.configure(text=f"{stats[key]}")
+
     def _load_activities(self, activity_filter: str = "All Activities") -> None:
         """Load and display activities in the log."""
-        # Clear existing
-        for widget in self.activity_scroll.winfo_children():
-            widget.destroy()
-        
+        # Reuse the last query for this filter while the log is unchanged; the
+        # version is read before querying so a write during it forces a re-query
+        version = self.activity_log.version
+        cached = self._activity_cache.get(activity_filter)
+        if cached is not None and cached[0] == version:
+            activities = cached[1]
         # Get activities based on filter
-        if activity_filter == "Devices Connected":
+        elif activity_filter == "Devices Connected":
             activities = self.activity_log.get_activities_by_type(ActivityType.DEVICE_CONNECTED, limit=100)
         elif activity_filter == "Devices Disconnected":
             activities = self.activity_log.get_activities_by_type(ActivityType.DEVICE_DISCONNECTED, limit=100)
         elif activity_filter == "System Events":
-            system_activities = []
-            for act_type in [ActivityType.SYSTEM_STARTUP, ActivityType.SYSTEM_SHUTDOWN, ActivityType.REFRESH_TRIGGERED]:
-                system_activities.extend(self.activity_log.get_activities_by_type(act_type, limit=50))
-            activities = sorted(system_activities, key=lambda x: x['timestamp'], reverse=True)[:100]
+            # One pass over the log, already in time order, instead of three scans and a sort
+            activities = self.activity_log.get_activities_by_types(
+                (ActivityType.SYSTEM_STARTUP, ActivityType.SYSTEM_SHUTDOWN, ActivityType.REFRESH_TRIGGERED),
+                limit=100
+            )
         elif activity_filter == "Profile Updates":
             activities = self.activity_log.get_activities_by_type(ActivityType.PROFILE_UPDATED, limit=100)
         else:
             activities = self.activity_log.get_recent_activities(limit=100)
+        self._activity_cache[activity_filter] = (version, activities)
         
         if not activities:
-            ctk.CTkLabel(
-                self.activity_scroll,
-                text="No activities recorded yet",
-                font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
-                text_color="gray"
-            ).pack(pady=50)
+            self._show_activity_rows(0)
+            if self._activity_empty_label is None:
+                self._activity_empty_label = ctk.CTkLabel(
+                    self.activity_scroll,
+                    text="No activities recorded yet",
+                    font=Theme.font(family=Theme.FONT_FAMILY, size=14),
+                    text_color="gray"
+                )
+            self._activity_empty_label.pack(pady=50)
             return
         
-        # Display each activity
-        for activity in activities:
-            self._create_activity_item(activity)
-    
-    def _create_activity_item(self, activity: Dict) -> None:
-        """Create a single activity item widget."""
-        # Severity colors
-        severity_colors = {
-            "error": Theme.ERROR,
-            "warning": Theme.WARNING,
-            "success": Theme.SUCCESS,
-            "info": Theme.PRIMARY
-        }
-        
-        # Icons by type
-        type_icons = {
-            "device_connected": "🟢",
-            "device_disconnected": "🔴",
-            "device_error": "⚠️",
-            "system_startup": "🚀",
-            "system_shutdown": "⏹️",
-            "profile_updated": "👤",
-            "settings_changed": "⚙️",
-            "refresh_triggered": "🔄"
-        }
+        if self._activity_empty_label is not None:
+            self._activity_empty_label.pack_forget()
         
+        # Row widgets are pooled: reloading rebinds the existing rows and only
+        # builds new ones when the list is longer than any shown before
+        while len(self._activity_rows) < len(activities):
+            self._activity_rows.append(self._create_activity_item())
+        for row, activity in zip(self._activity_rows, activities):
+            self._bind_activity_item(row, activity)
+        self._show_activity_rows(len(activities))
+    
+    def _show_activity_rows(self, count: int) -> None:
+        """Pack the first count pooled activity rows and hide the rest."""
+        rows = self._activity_rows
+        # Rows past the shown ones are unpacked, so packing appends them in order
+        for row in rows[self._activity_rows_shown:count]:
+            row['frame'].pack(fill="x", pady=5, padx=5)
+        for row in rows[count:self._activity_rows_shown]:
+            row['frame'].pack_forget()
+        self._activity_rows_shown = count
+    
+    def _create_activity_item(self) -> Dict[str, Any]:
+        """Create the widgets of one activity row; _bind_activity_item fills them in."""
         # Container for each activity
         item_frame = ctk.CTkFrame(
             self.activity_scroll,
             fg_color=(Theme.SECONDARY, "#2A2A2A"),
             height=70
         )
-        item_frame.pack(fill="x", pady=5, padx=5)
         item_frame.pack_propagate(False)
         
         # Left side - Icon and severity indicator
@@ -907,20 +1141,20 @@ class DashboardApp(ctk.CTk):
         left_frame.pack_propagate(False)
         
         # Severity bar
-        severity_color = severity_colors.get(activity['severity'], Theme.PRIMARY)
-        ctk.CTkFrame(
+        severity_bar = ctk.CTkFrame(
             left_frame,
             width=4,
-            fg_color=severity_color
-        ).pack(side="left", fill="y")
+            fg_color=Theme.PRIMARY
+        )
+        severity_bar.pack(side="left", fill="y")
         
         # Icon
-        icon = type_icons.get(activity['type'], "📋")
-        ctk.CTkLabel(
+        icon_label = ctk.CTkLabel(
             left_frame,
-            text=icon,
-            font=ctk.CTkFont(size=20)
-        ).pack(side="left", padx=10)
+            text="",
+            font=Theme.font(size=20)
+        )
+        icon_label.pack(side="left", padx=10)
         
         # Middle - Content
         content_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
@@ -930,70 +1164,124 @@ class DashboardApp(ctk.CTk):
         title_row = ctk.CTkFrame(content_frame, fg_color="transparent")
         title_row.pack(fill="x", pady=(8, 2))
         
-        ctk.CTkLabel(
+        name_label = ctk.CTkLabel(
             title_row,
-            text=activity['device_name'],
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=13, weight="bold"),
+            text="",
+            font=Theme.font(family=Theme.FONT_FAMILY, size=13, weight="bold"),
             anchor="w"
-        ).pack(side="left")
+        )
+        name_label.pack(side="left")
         
         # Type badge
-        ctk.CTkLabel(
+        badge = ctk.CTkLabel(
             title_row,
-            text=activity['type'].replace('_', ' ').title(),
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=9),
+            text="",
+            font=Theme.font(family=Theme.FONT_FAMILY, size=9),
             text_color="white",
-            fg_color=severity_color,
+            fg_color=Theme.PRIMARY,
             corner_radius=3,
             padx=6,
             pady=2
-        ).pack(side="left", padx=(10, 0))
+        )
+        badge.pack(side="left", padx=(10, 0))
         
         # Message
-        ctk.CTkLabel(
+        message_label = ctk.CTkLabel(
             content_frame,
-            text=activity['message'],
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11),
+            text="",
+            font=Theme.font(family=Theme.FONT_FAMILY, size=11),
             text_color="gray",
             anchor="w"
-        ).pack(fill="x", pady=(0, 2))
+        )
+        message_label.pack(fill="x", pady=(0, 2))
         
-        # Details if available
-        if activity.get('details'):
-            details_text = " | ".join([f"{k}: {v}" for k, v in activity['details'].items() if k != 'last_seen'])
-            if details_text:
-                ctk.CTkLabel(
-                    content_frame,
-                    text=details_text,
-                    font=ctk.CTkFont(family="Consolas", size=9),
-                    text_color="#666",
-                    anchor="w"
-                ).pack(fill="x")
+        # Details; packed by _bind_activity_item when the activity has any
+        details_label = ctk.CTkLabel(
+            content_frame,
+            text="",
+            font=Theme.font(family="Consolas", size=9),
+            text_color="#666",
+            anchor="w"
+        )
         
         # Right side - Timestamp
         time_frame = ctk.CTkFrame(item_frame, fg_color="transparent", width=120)
         time_frame.pack(side="right", fill="y", padx=10)
         time_frame.pack_propagate(False)
         
-        # Parse and format timestamp
-        timestamp = datetime.datetime.fromisoformat(activity['timestamp'])
-        time_str = timestamp.strftime("%H:%M:%S")
-        date_str = timestamp.strftime("%Y-%m-%d")
-        
-        ctk.CTkLabel(
+        time_label = ctk.CTkLabel(
             time_frame,
-            text=time_str,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12, weight="bold"),
+            text="",
+            font=Theme.font(family=Theme.FONT_FAMILY, size=12, weight="bold"),
             anchor="e"
-        ).pack(side="top", pady=(10, 0))
+        )
+        time_label.pack(side="top", pady=(10, 0))
         
-        ctk.CTkLabel(
+        date_label = ctk.CTkLabel(
             time_frame,
-            text=date_str,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=9),
+            text="",
+            font=Theme.font(family=Theme.FONT_FAMILY, size=9),
             text_color="gray",
             anchor="e"
-        ).pack(side="top")
+        )
+        date_label.pack(side="top")
+        
+        return {
+            'frame': item_frame,
+            'severity_bar': severity_bar,
+            'icon': icon_label,
+            'name': name_label,
+            'badge': badge,
+            'message': message_label,
+            'details': details_label,
+            'details_shown': False,
+            'time': time_label,
+            'date': date_label,
+            'activity': None
+        }
+    
+    def _bind_activity_item(self, row: Dict[str, Any], activity: Dict) -> None:
+        """Show an activity in a pooled row."""
+        # Logged activities are never modified, so a row still bound to the
+        # same entry is already up to date
+        if row['activity'] is activity:
+            return
+        row['activity'] = activity
+        
+        severity_color = _SEVERITY_COLORS.get(activity['severity'], Theme.PRIMARY)
+        row['severity_bar'].configure(fg_color=severity_color)
+        row['icon'].configure(text=_ACTIVITY_TYPE_ICONS.get(activity['type'], "📋"))
+        row['name'].configure(text=activity['device_name'])
+        row['badge'].configure(
+            text=activity['type'].replace('_', ' ').title(),
+            fg_color=severity_color
+        )
+        row['message'].configure(text=activity['message'])
+        
+        # Details if available
+        details = activity.get('details')
+        details_text = ""
+        if details:
+            details_text = " | ".join(f"{k}: {v}" for k, v in details.items() if k != 'last_seen')
+        if details_text:
+            row['details'].configure(text=details_text)
+            if not row['details_shown']:
+                row['details'].pack(fill="x")
+                row['details_shown'] = True
+        elif row['details_shown']:
+            row['details'].pack_forget()
+            row['details_shown'] = False
+        
+        # Timestamps are stored by isoformat(), so date and time are fixed
+        # slices; anything else is parsed
+        ts = activity['timestamp']
+        if len(ts) >= 19 and ts[10] == 'T':
+            date_str, time_str = ts[:10], ts[11:19]
+        else:
+            timestamp = datetime.datetime.fromisoformat(ts)
+            date_str, time_str = timestamp.strftime("%Y-%m-%d"), timestamp.strftime("%H:%M:%S")
+        row['time'].configure(text=time_str)
+        row['date'].configure(text=date_str)
     
     def _filter_activities(self, choice):
         """Filter activities based on selection."""
@@ -1001,6 +1289,7 @@ class DashboardApp(ctk.CTk):
     
     def _refresh_activity_log(self):
         """Refresh the activity log display."""
+        self._update_activity_stats()
         self._load_activities(self.filter_var.get())
         self.activity_log.log_activity(ActivityType.REFRESH_TRIGGERED, "Activity log refreshed", "System")
     
@@ -1028,27 +1317,22 @@ class DashboardApp(ctk.CTk):
         if result:
             self.activity_log.clear_logs()
             self.activity_log.log_activity(ActivityType.SYSTEM_STARTUP, "Activity logs cleared", "System")
+            self._update_activity_stats()
             self._load_activities(self.filter_var.get())
             messagebox.showinfo("Success", "✅ Activity logs cleared")
 
     def _copy_device_info(self):
         """Copy selected device information to clipboard."""
-        if not hasattr(self, 'detail_vars'):
+        if self.detail_vars is None:
             return
         
         try:
-            lines = []
-            for k, var in self.detail_vars.items():
-                value = var.get()
-                if value and value != "N/A":
-                    lines.append(f"{k}: {value}")
-                
-            data = "\n".join(lines)
+            data = self._current_detail_text
             if data.strip():
                 self.clipboard_clear()
                 self.clipboard_append(data)
-                self.lbl_status.configure(text="✅ Copied to clipboard!", text_color="#27AE60")
-                self.after(2000, lambda: self.lbl_status.configure(text="Ready", text_color="gray"))
+                self._set_status("✅ Copied to clipboard!", "#27AE60")
+                self.after(2000, lambda: self._set_status("Ready", "gray"))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to copy: {e}")
 
@@ -1056,18 +1340,57 @@ class DashboardApp(ctk.CTk):
 
     def _start_refresh_loop(self):
         """Background loop to refresh device data periodically."""
-        if self.current_view == "dashboard":
-            self._refresh_data()
-        self.after(5000, self._start_refresh_loop)
+        # Nothing is seen while minimized or hidden, so don't scan and wake up far
+        # less often; while another application has focus, scan at a slower pace
+        self._refresh_backed_off = True
+        if self.state() == "iconic" or not self.winfo_viewable():
+            interval = self.HIDDEN_REFRESH_INTERVAL_MS
+        else:
+            # _refresh_data drops the tick while a scan is still running
+            if self.current_view == "dashboard":
+                self._refresh_data()
+            if self.focus_displayof() is None:
+                interval = max(self.UNFOCUSED_REFRESH_INTERVAL_MS, self._refresh_interval_ms)
+            else:
+                interval = self._refresh_interval_ms
+                self._refresh_backed_off = False
+        self._refresh_after_id = self.after(interval, self._start_refresh_loop)
+
+    def _on_focus_in(self):
+        """Refresh right away when the window comes back after the loop backed off."""
+        if not self._refresh_backed_off:
+            return
+        if self._refresh_after_id:
+            self.after_cancel(self._refresh_after_id)
+        self._start_refresh_loop()
 
     def _on_search_changed(self):
-        """Handle search text changes."""
-        if hasattr(self, 'tree_physical') and hasattr(self, 'tree_virtual'):
-            self._refresh_data()
+        """Handle search text changes, debounced so typing never triggers a rescan."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(self.SEARCH_DEBOUNCE_MS, self._apply_filter)
+
+    def _clear_search(self):
+        """Clear the search text and re-filter, wherever the focus is."""
+        if self.search_entry is not None and self.search_entry.get():
+            self.search_entry.delete(0, 'end')
+            self._on_search_changed()
+
+    def _submit_search(self):
+        """Filter immediately on Enter instead of waiting out the debounce."""
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._apply_filter()
+
+    def _apply_filter(self):
+        """Re-filter the last scanned devices with the current search text."""
+        self._search_after_id = None
+        if self.current_view == "dashboard" and self.tree_physical is not None:
+            self._update_tree(*self._last_scan)
 
     def _focus_search(self):
         """Focus the search entry."""
-        if hasattr(self, 'search_entry') and self.current_view == "dashboard":
+        if self.search_entry is not None and self.current_view == "dashboard":
             self.search_entry.focus_set()
 
     def _manual_refresh(self):
@@ -1080,22 +1403,82 @@ class DashboardApp(ctk.CTk):
         if self.current_view != "dashboard" or self.is_refreshing:
             return
         
-        if not hasattr(self, 'tree_physical') or not hasattr(self, 'tree_virtual'):
+        if self.tree_physical is None or self.tree_virtual is None:
             return
         
         self.is_refreshing = True
-        if hasattr(self, 'lbl_status'):
-            self.lbl_status.configure(text="⚡ Scanning devices...", text_color="#F39C12")
-        if hasattr(self, 'refresh_btn'):
+        self._set_status("⚡ Scanning devices...", "#F39C12")
+        if self.refresh_btn is not None:
             self.refresh_btn.configure(state="disabled")
             
-        threading.Thread(target=self._fetch_devices_thread, daemon=True).start()
+        self._scan_event.set()
+        self.after(self.RESULT_POLL_MS, self._pump_results)
+
+    def _pump_results(self):
+        """Apply everything the scan worker queued, polling until the scan is done."""
+        # Read the flag first: the worker queues its results before clearing it
+        done = not self.is_refreshing
+        while True:
+            try:
+                kind, payload = self._scan_results.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "devices":
+                self._update_tree(*payload)
+                if self._drives_pending and self.current_view == "scan":
+                    self._drives_pending = False
+                    self._populate_drives()
+            elif kind == "error":
+                self._handle_fetch_error(payload)
+            elif kind == "autoscan":
+                self.after(500, lambda path=payload: self._trigger_autoscan_ui(path))
+        
+        if done:
+            self._enable_refresh_button()
+        else:
+            self.after(self.RESULT_POLL_MS, self._pump_results)
+
+    def _scan_worker(self):
+        """Run the device scans requested by _refresh_data, one at a time."""
+        while True:
+            self._scan_event.wait()
+            self._scan_event.clear()
+            self._fetch_devices_thread()
 
     def _fetch_devices_thread(self):
-        """Fetch devices in background thread."""
+        """Fetch devices in background thread; results go through _scan_results."""
         try:
+            started = time.monotonic()
             devices = self.dm.get_all_devices()
             self.last_update_time = datetime.datetime.now()
+            self._last_update_str = self.last_update_time.strftime("%H:%M:%S")
+            
+            # Give slow hosts room: double the interval per slow scan, up to the
+            # hidden-window interval, and drop back once scans are quick again
+            if time.monotonic() - started > self.SLOW_SCAN_SECONDS:
+                self._refresh_interval_ms = min(self._refresh_interval_ms * 2,
+                                                self.HIDDEN_REFRESH_INTERVAL_MS)
+            else:
+                self._refresh_interval_ms = self.REFRESH_INTERVAL_MS
+            
+            # Derive the search key and tree row text once per distinct device
+            # rather than per keystroke or render, reusing the last scan's. They
+            # are kept here, not on the device dicts DeviceManager caches
+            previous = self._row_texts
+            row_texts = {}
+            for d in devices:
+                key = _row_texts_key(d)
+                if key not in row_texts:
+                    row_texts[key] = previous.get(key) or _derive_row_texts(d)
+            self._row_texts = row_texts
+
+            # Signature of every detail field, computed here rather than on the
+            # Tk thread; the tree sync compares it to skip unchanged refreshes
+            signature = tuple(sorted(
+                tuple(str(d.get(key, '')) for _, key in _DETAIL_FIELDS)
+                for d in devices
+            ))
+            self._last_scan = (devices, signature)
             
             # Check for device changes (only newly connected ones)
             new_devices = self._get_new_devices(devices)
@@ -1106,21 +1489,19 @@ class DashboardApp(ctk.CTk):
             # Auto-scan if a new Storage device is connected
             self._check_and_autoscan(new_devices)
 
-            self.after(0, lambda: self._update_tree(devices))
+            self._scan_results.put(("devices", (devices, signature)))
         except Exception as e:
+            if self.dm.closed:
+                return  # Shutting down; nothing to report
             error_msg = f"Error scanning devices: {e}"
             self.activity_log.log_activity(ActivityType.DEVICE_ERROR, str(e), "System")
-            self.after(0, lambda msg=error_msg: self._handle_fetch_error(msg))
+            self._scan_results.put(("error", error_msg))
         finally:
             self.is_refreshing = False
-            self.after(0, self._enable_refresh_button)
             
     def _get_new_devices(self, current_devices_list):
         """Extract only newly connected devices by comparing with previous state."""
         new_devs = []
-        if not hasattr(self, '_previous_device_paths'):
-            self._previous_device_paths = set()
-            
         current_paths = {d['path'] for d in current_devices_list}
         
         for d in current_devices_list:
@@ -1147,7 +1528,7 @@ class DashboardApp(ctk.CTk):
                 self.activity_log.log_activity(ActivityType.SYSTEM_STARTUP, f"Auto-scanning new drive: {drive_letter}", "System")
                 
                 # We need to switch to scan view on main thread
-                self.after(500, lambda path=drive_letter: self._trigger_autoscan_ui(path))
+                self._scan_results.put(("autoscan", drive_letter))
                 break # Scan only one at a time to avoid chaos
 
     def _trigger_autoscan_ui(self, path):
@@ -1173,7 +1554,7 @@ class DashboardApp(ctk.CTk):
     
     def _enable_refresh_button(self):
         """Enable the refresh button safely."""
-        if hasattr(self, 'refresh_btn') and self.refresh_btn.winfo_exists():
+        if self.refresh_btn is not None and self.refresh_btn.winfo_exists():
             try:
                 self.refresh_btn.configure(state="normal")
             except:
@@ -1181,9 +1562,9 @@ class DashboardApp(ctk.CTk):
     
     def _handle_fetch_error(self, error_msg):
         """Handle device fetch errors."""
-        if hasattr(self, 'lbl_status') and self.lbl_status.winfo_exists():
+        if self.lbl_status is not None and self.lbl_status.winfo_exists():
             try:
-                self.lbl_status.configure(text="❌ Scan failed", text_color="#E74C3C")
+                self._set_status("❌ Scan failed", "#E74C3C")
             except:
                 pass
         try:
@@ -1191,193 +1572,208 @@ class DashboardApp(ctk.CTk):
         except:
             pass
 
-    def _update_tree(self, devices):
-        """Update device tree with new data, separating physical and virtual devices."""
-        if self.current_view != "dashboard" or not hasattr(self, 'tree_physical'):
+    def _update_tree(self, devices, signature):
+        """Update device tree with new data, separating physical and virtual devices.
+
+        signature is the scan worker's signature of devices (see _fetch_devices_thread).
+        """
+        if self.current_view != "dashboard" or self.tree_physical is None:
             return
 
-        # Helper to capture state
-        def get_tree_state(tree):
-            state = {
-                "selected": None, # dict or string
-                "expanded": set(), # set of category names
-                "scroll_pos": tree.yview() # Capture scroll position (top, bottom)
-            }
-            
-            # Capture Expanded Categories
-            for child in tree.get_children():
-                if tree.item(child, 'open'):
-                    # Check for new deterministic IID (cat_...) or fallback to parsing
-                    iid = child
-                    if iid.startswith("cat_"):
-                        state["expanded"].add(iid[4:]) # remove "cat_"
-                    else:
-                        # Fallback for initial state text parsing
-                        text = tree.item(child, "text") 
-                        try:
-                            # Extract category name from " 🔌 USB (N)"
-                            parts = text.split(" (")[0].strip().split(" ")
-                            if len(parts) >= 1:
-                                cat_guess = parts[-1]
-                                if cat_guess:
-                                    state["expanded"].add(cat_guess)
-                        except:
-                            pass
-
-            # Capture Selection
-            selection = tree.selection()
-            if selection:
-                iid = selection[0]
-                if iid in self.current_devices:
-                    state["selected"] = {"type": "device", "path": self.current_devices[iid].get('path')}
-                elif iid.startswith("cat_"):
-                    state["selected"] = {"type": "category", "cat": iid[4:]}
-                else:
-                    # Fallback for old category IID
-                    try:
-                        text = tree.item(iid, "text")
-                        parts = text.split(" (")[0].strip().split(" ")
-                        if len(parts) >= 1:
-                            cat_guess = parts[-1]
-                            state["selected"] = {"type": "category", "cat": cat_guess}
-                    except:
-                        pass
-            return state
-
-        phys_state = get_tree_state(self.tree_physical)
-        virt_state = get_tree_state(self.tree_virtual)
-
-        # Filter
         search_query = ""
-        if hasattr(self, 'search_entry'):
-            search_query = self.search_entry.get().lower()
+        if self.search_entry is not None:
+            search_query = self.search_entry.get().casefold()
+
+        # Nothing changed since the last sync (the usual idle refresh): only
+        # bump the timestamp. The signature covers every detail field, so the
+        # details panel never keeps showing a superseded record
+        if signature == self._last_sig and search_query == self._last_query:
+            self._update_status_label(*self._last_tree_counts)
+            return
+        self._last_sig = signature
+        self._last_query = search_query
+
+        # One pass groups devices (with their row text) by port type and
+        # category, matches each against the search once and counts the
+        # matches for the stat cards
+        physical_devices = defaultdict(list)
+        virtual_devices = defaultdict(list)
+        matches = set() if search_query else None  # id() of matching devices
+        counts = {'total': 0, 'usb': 0, 'hid': 0, 'network': 0}
+        row_texts = self._row_texts
+        for d in devices:
+            texts = row_texts.get(_row_texts_key(d))
+            if texts is None:
+                texts = _derive_row_texts(d)
+            search_key, display_text = texts
+            port_type = d.get('port_type', 'Physical')
+            if port_type == 'Physical':
+                physical_devices[d['category']].append((d, display_text))
+            elif port_type == 'Virtual':
+                virtual_devices[d['category']].append((d, display_text))
             if search_query:
-                devices = [d for d in devices if search_query in d['name'].lower() 
-                           or search_query in str(d.get('manufacturer', '')).lower()
-                           or search_query in d['category'].lower()]
-
-        # Separate devices by port type
-        physical_devices = [d for d in devices if d.get('port_type', 'Physical') == 'Physical']
-        virtual_devices = [d for d in devices if d.get('port_type', 'Physical') == 'Virtual']
+                if search_query not in search_key:
+                    continue
+                matches.add(id(d))
+            counts['total'] += 1
+            card = _STAT_CARD_KEYS.get(d['category'])
+            if card:
+                counts[card] += 1
 
         # Update Statistics (combined)
-        self._update_statistics(devices)
+        self._update_statistics(counts)
 
-        # Clear both trees
-        self.tree_physical.delete(*self.tree_physical.get_children())
-        self.tree_virtual.delete(*self.tree_virtual.get_children())
+        # Sync both trees in place; selection, expansion and scroll position
+        # survive because unchanged rows keep their item ids, and rows hidden
+        # by the search are only detached
         self.current_devices = {}
+        self._last_tree_counts = (
+            self._populate_tree(self.tree_physical, physical_devices, matches),
+            self._populate_tree(self.tree_virtual, virtual_devices, matches),
+        )
         
-        # Update Physical Devices Tab
-        self._populate_tree(self.tree_physical, physical_devices, phys_state, search_query)
-        if phys_state["scroll_pos"]:
-            try:
-                self.tree_physical.yview_moveto(phys_state["scroll_pos"][0])
-            except:
-                pass
-        
-        # Update Virtual Devices Tab
-        self._populate_tree(self.tree_virtual, virtual_devices, virt_state, search_query)
-        if virt_state["scroll_pos"]:
-            try:
-                self.tree_virtual.yview_moveto(virt_state["scroll_pos"][0])
-            except:
-                pass
-
-        # Update status
-        if hasattr(self, 'lbl_status') and self.last_update_time:
-            time_str = self.last_update_time.strftime("%H:%M:%S")
-            phys_count = len(physical_devices)
-            virt_count = len(virtual_devices)
-            self.lbl_status.configure(
-                text=f"✅ Updated at {time_str} | 🔌{phys_count} Physical | 💻{virt_count} Virtual", 
-                text_color="#27AE60"
+        # Rows keep their iids across syncs; follow a rescan that replaced the
+        # shown device's record, or removed the device
+        if self._detail_iid is not None:
+            d = self.current_devices.get(self._detail_iid)
+            if d is not self._detail_device:
+                self._show_device_details(d)
+        self._update_status_label(*self._last_tree_counts)
+
+    def _update_status_label(self, phys_count: int, virt_count: int) -> None:
+        """Show the last update time and the physical/virtual device counts."""
+        if self._last_update_str:
+            self._set_status(
+                f"✅ Updated at {self._last_update_str} | 🔌{phys_count} Physical | 💻{virt_count} Virtual",
+                "#27AE60"
             )
-    
-    def _populate_tree(self, tree, devices, tree_state, search_query):
-        """Populate a tree view with devices with persistent selection."""
-        if not devices:
-            tree.insert("", "end", text="  ℹ️ No devices found")
+
+    def _set_status(self, text: str, color: str) -> None:
+        """Set the dashboard status line, touching only what changed."""
+        if self.lbl_status is None:
             return
-        
-        categories = {}
-        for d in devices:
-            cat = d['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(d)
-        
-        # Category icons mapping
-        category_icons = {
-            "USB": "🔌",
-            "USB Port": "🔌",
-            "USB Storage": "💿",
-            "HID": "⌨️",
-            "Keyboard": "⌨️",
-            "Mouse": "🖱️",
-            "Network": "🌐",
-            "Ethernet": "🔗",
-            "Wi-Fi": "📶",
-            "Storage": "💾",
-            "Bluetooth": "📡",
-            "Display": "🖥️",
-            "HDMI": "🖥️"
-        }
+        # A text-only configure skips CTkLabel's canvas redraw; a colour change needs it
+        if color != self.lbl_status.cget("text_color"):
+            self.lbl_status.configure(text=text, text_color=color)
+        elif text != self.lbl_status.cget("text"):
+            self.lbl_status.configure(text=text)
+    
+    def _populate_tree(self, tree, categories, matches) -> int:
+        """
+        Sync a tree view with (device, row text) pairs grouped by category,
+        inserting, updating or deleting only the rows that changed since the
+        previous render. Rows whose device isn't in matches (ids of devices
+        matching the search, None when there is no search) are detached rather
+        than deleted, so editing the query only reattaches them. Returns the
+        number of matching rows.
+        """
+        # (category,) -> category row, (category, path or name, occurrence) -> device row;
+        # both map to (iid, rendered text)
+        index = self._tree_index.get(tree, {})
+        
+        ordered_cats = [cat for cat in _CATEGORY_ICONS if cat in categories]
+        if len(ordered_cats) < len(categories):
+            ordered_cats += sorted(cat for cat in categories if cat not in _CATEGORY_ICONS)
+        
+        new_index = {}
+        seen = {}
+        visible_cats = []
+        cat_children = []
+        match_count = 0
+        pending = []  # New rows as parent, iid, text, open; inserted in one call below
+        tk_call = tree.tk.call
+        tree_w = tree._w
         
         # Insert by categories
-        for cat in sorted(categories.keys()):
+        for cat in ordered_cats:
             dev_list = categories[cat]
-            if not dev_list:
-                continue
 
             # Deterministic IID for category
             cat_iid = f"cat_{cat}"
-
-            is_open = bool(search_query) or cat in tree_state["expanded"]
-            cat_icon = category_icons.get(cat, "📁")
+            cat_entry = index.pop((cat,), None)
+            if cat_entry is None:
+                text_slot = len(pending) + 2  # Filled in once the matches are counted
+                pending += ("", cat_iid, "", int(matches is not None))
+            elif matches is not None:
+                tree.item(cat_iid, open=True)
             
-            # Avoid duplicate insertion if somehow called incorrectly, though we cleared tree
-            if not tree.exists(cat_iid):
-                tree.insert("", "end", iid=cat_iid, text=f"{cat_icon} {cat} ({len(dev_list)})", open=is_open)
-            
-            # Check for category selection restoration
-            sel_state = tree_state.get("selected")
-            if sel_state and sel_state["type"] == "category" and sel_state["cat"] == cat:
-                tree.selection_set(cat_iid)
-                tree.see(cat_iid)
-            
-            for d in dev_list:
-                status_str = str(d['status']).lower()
-                if "ok" in status_str or "connected" in status_str:
-                    status_icon = "✅"
-                elif "disconnected" in status_str or "error" in status_str:
-                    status_icon = "❌"
+            child_iids = []
+            for d, display_text in dev_list:
+                ident = (cat, d.get('path') or d['name'])
+                occurrence = seen.get(ident, 0)
+                seen[ident] = occurrence + 1
+                key = ident + (occurrence,)
+                
+                entry = index.pop(key, None)
+                if entry is None:
+                    child_id = f"dev{next(self._row_ids)}"
+                    pending += (cat_iid, child_id, display_text, 0)
                 else:
-                    status_icon = "⚠️"
-                    
-                display_text = f"{status_icon} {d['name'].strip()}"
-                child_id = tree.insert(cat_iid, "end", text=display_text)
-                self.current_devices[child_id] = d
+                    # Raw Tcl call skips ttk's per-call option formatting
+                    child_id, old_text = entry
+                    if old_text != display_text:
+                        tk_call(tree_w, "item", child_id, "-text", display_text)
                 
-                # Restore device selection (check path)
-                if sel_state and sel_state["type"] == "device" and d.get('path') == sel_state["path"]:
-                    tree.selection_set(child_id)
-                    tree.see(child_id)
+                new_index[key] = (child_id, display_text)
+                self.current_devices[child_id] = d
+                if matches is None or id(d) in matches:
+                    child_iids.append(child_id)
+            
+            cat_text = f"{_CATEGORY_ICONS.get(cat, '📁')} {cat} ({len(child_iids)})"
+            if cat_entry is None:
+                pending[text_slot] = cat_text
+            elif cat_entry[1] != cat_text:
+                tree.item(cat_iid, text=cat_text)
+            new_index[(cat,)] = (cat_iid, cat_text)
+            
+            cat_children.append((cat_iid, child_iids))
+            if child_iids:
+                visible_cats.append(cat_iid)
+                match_count += len(child_iids)
+        
+        # A first fill inserts every row; do it in a single Tcl round trip
+        if pending:
+            tk_call("apply", _TREE_INSERT_LAMBDA, tree_w, tuple(pending))
+        
+        # set_children detaches the rows left out, keeping their item ids
+        for cat_iid, child_iids in cat_children:
+            if tree.get_children(cat_iid) != tuple(child_iids):
+                tree.set_children(cat_iid, *child_iids)
+        
+        # Drop rows whose device is gone, then categories that emptied out
+        stale_rows = [iid for key, (iid, _) in index.items() if len(key) > 1]
+        if stale_rows:
+            tree.delete(*stale_rows)
+        stale_cats = [iid for key, (iid, _) in index.items() if len(key) == 1]
+        if stale_cats:
+            tree.delete(*stale_cats)
+        
+        if visible_cats:
+            if tree.exists("empty"):
+                tree.delete("empty")
+            top_level = visible_cats
+        else:
+            if not tree.exists("empty"):
+                tree.insert("", "end", iid="empty", text="  ℹ️ No devices found")
+            top_level = ["empty"]
+        
+        if tree.get_children() != tuple(top_level):
+            tree.set_children("", *top_level)
+        
+        self._tree_index[tree] = new_index
+        return match_count
     
-    def _update_statistics(self, devices):
-        """Update statistics cards with device counts."""
-        if not hasattr(self, 'stats_cards'):
+    def _update_statistics(self, counts: Dict[str, int]) -> None:
+        """Update statistics cards with device counts keyed by card."""
+        if self.stats_cards is None:
             return
-            
-        total = len(devices)
-        usb_count = len([d for d in devices if d['category'] == 'USB'])
-        hid_count = len([d for d in devices if d['category'] in ['HID', 'Keyboard', 'Mouse']])
-        network_count = len([d for d in devices if d['category'] == 'Network'])
         
-        self.stats_cards['total'].set(str(total))
-        self.stats_cards['usb'].set(str(usb_count))
-        self.stats_cards['hid'].set(str(hid_count))
-        self.stats_cards['network'].set(str(network_count))
+        # Only write cards whose count changed; each write re-renders its label
+        last = self._last_counts
+        for key, count in counts.items():
+            if last[key] != count:
+                self.stats_cards[key].configure(text=str(count))
+                last[key] = count
 
     def _on_device_select(self, event):
         """Handle device selection in tree view."""
@@ -1386,27 +1782,39 @@ class DashboardApp(ctk.CTk):
         selection = tree.selection()
         
         if not selection:
+            self._detail_iid = None
             self.btn_copy.configure(state="disabled")
             return
         
-        iid = selection[0]
-        if iid in self.current_devices:
-            d = self.current_devices[iid]
-            self.detail_vars["Name"].set(d.get("name", "N/A"))
-            self.detail_vars["Category"].set(d.get("category", "N/A"))
-            self.detail_vars["Type"].set(d.get("type", "N/A"))
-            self.detail_vars["Port Type"].set(d.get("port_type", "N/A"))
-            self.detail_vars["Status"].set(d.get("status", "N/A"))
-            self.detail_vars["Manufacturer"].set(d.get("manufacturer", "N/A"))
-            self.detail_vars["VID"].set(d.get("vid", "N/A"))
-            self.detail_vars["PID"].set(d.get("pid", "N/A"))
-            self.detail_vars["Driver"].set(d.get("driver", "N/A"))
-            self.detail_vars["Path"].set(d.get("path", "N/A"))
+        self._detail_iid = selection[0]
+        self._show_device_details(self.current_devices.get(self._detail_iid))
+
+    def _show_device_details(self, d: Optional[Dict]) -> None:
+        """Show a device in the details panel, or clear the panel for None."""
+        self._detail_device = d
+        if d is not None:
+            # Build the copy text alongside, so copying needs no StringVar reads
+            lines = []
+            last_values = self._last_detail_values
+            for row, (label, key) in enumerate(_DETAIL_FIELDS):
+                value = d.get(key, "N/A")
+                # Each set() fires a Tcl trace and redraws the entry
+                if last_values.get(label) != value:
+                    self.detail_vars[label].set(value)
+                    last_values[label] = value
+                has_value = bool(value) and value != "N/A"
+                if has_value:
+                    lines.append(f"{label}: {value}")
+                self._set_detail_field_visible(label, row, has_value or label in _CORE_DETAIL_FIELDS)
+            self._current_detail_text = "\n".join(lines)
             
             self.btn_copy.configure(state="normal")
         else:
-            for var in self.detail_vars.values():
-                var.set("")
+            for label, var in self.detail_vars.items():
+                if self._last_detail_values.get(label):
+                    var.set("")
+                    self._last_detail_values[label] = ""
+            self._current_detail_text = ""
             self.btn_copy.configure(state="disabled")
 
     def show_custom_scan(self):
@@ -1425,12 +1833,12 @@ class DashboardApp(ctk.CTk):
         header_frame.pack(fill="x", pady=(0, 20))
         
         # Icon for the page (User asked for icon)
-        ctk.CTkLabel(header_frame, text="💾", font=ctk.CTkFont(size=28)).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(header_frame, text="💾", font=Theme.font(size=28)).pack(side="left", padx=(0, 10))
         
         ctk.CTkLabel(
             header_frame, 
             text="USB Drive Scan", 
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=24, weight="bold")
+            font=Theme.font(family=Theme.FONT_FAMILY, size=24, weight="bold")
         ).pack(side="left")
 
         # --- Scan Controls ---
@@ -1440,7 +1848,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             controls_frame, 
             text="Select Drive:", 
-            font=ctk.CTkFont(size=14)
+            font=Theme.font(size=14)
         ).pack(side="left", padx=20)
         
         self.drive_combobox = ctk.CTkComboBox(
@@ -1455,7 +1863,7 @@ class DashboardApp(ctk.CTk):
             controls_frame,
             text="🔄",
             width=40,
-            command=self._populate_drives,
+            command=self._rescan_drives,
             fg_color=Theme.SECONDARY,
             hover_color=Theme.SECONDARY_Hover
         )
@@ -1476,7 +1884,7 @@ class DashboardApp(ctk.CTk):
             text="🚀 Start Scan",
             width=120,
             command=self._start_scan,
-            font=ctk.CTkFont(weight="bold")
+            font=Theme.font(weight="bold")
         )
         self.btn_scan.pack(side="left", padx=20)
 
@@ -1484,13 +1892,25 @@ class DashboardApp(ctk.CTk):
         self.results_frame = ctk.CTkScrollableFrame(self.main_container, fg_color="transparent")
         self.results_frame.pack(fill="both", expand=True)
 
-        # Auto-scan for drives
-        self.after(100, self._populate_drives)
+        # List the drives from the last scan, then refresh them from a new one
+        self._populate_drives()
+        self._rescan_drives()
+
+    def _rescan_drives(self):
+        """Rescan devices on the scan worker; the dropdown is refilled when it lands."""
+        self._drives_pending = True
+        if not self.is_refreshing:
+            self.is_refreshing = True
+            self._scan_event.set()
+            self.after(self.RESULT_POLL_MS, self._pump_results)
 
     def _populate_drives(self):
-        """Scan for USB drives and populate the dropdown."""
+        """Populate the dropdown with the USB drives found by the latest device scan."""
+        devices = self._last_scan[0]
+        if not devices:
+            return  # No scan has finished yet; _rescan_drives fills it in
+        
         try:
-            devices = self.dm.get_all_devices()
             drive_options = []
             
             for d in devices:
@@ -1511,8 +1931,13 @@ class DashboardApp(ctk.CTk):
             if not drive_options:
                 drive_options = ["No USB Drives Found"]
             
+            # Refills follow rescans, so keep the user's pick while it is still
+            # listed, and keep a browsed folder
+            selected = self.drive_combobox.get()
+            if selected not in drive_options and os.path.isdir(selected):
+                drive_options.append(selected)
             self.drive_combobox.configure(values=drive_options)
-            self.drive_combobox.set(drive_options[0])
+            self.drive_combobox.set(selected if selected in drive_options else drive_options[0])
             
         except Exception as e:
             print(f"Error populating drives: {e}")
@@ -1553,21 +1978,34 @@ class DashboardApp(ctk.CTk):
             widget.destroy()
             
         # Loading indicator
-        loading_lbl = ctk.CTkLabel(self.results_frame, text="⏳ Scanning... Please wait.", font=ctk.CTkFont(size=16))
+        loading_lbl = ctk.CTkLabel(self.results_frame, text="⏳ Scanning... Please wait.", font=Theme.font(size=16))
         loading_lbl.pack(pady=50)
         
-        # Run in thread
-        threading.Thread(target=self._run_scan_thread, args=(path,), daemon=True).start()
+        # Run in thread; the outcome comes back through a queue polled from the UI thread
+        outcome: queue.Queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._run_scan_thread, args=(path, outcome), daemon=True).start()
+        self.after(self.RESULT_POLL_MS, self._poll_scan_outcome, outcome)
 
-    def _run_scan_thread(self, path):
+    def _run_scan_thread(self, path, outcome):
+        """Analyze path in a background thread; never touches Tk."""
         try:
             from src.usb_analytics import USBAnalytics
             analytics = USBAnalytics()
-            results = analytics.analyze_path(path)
-            
-            self.after(0, lambda: self._display_scan_results(results))
+            outcome.put(("results", analytics.analyze_path(path)))
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Scan Error", str(e)))
+            outcome.put(("error", str(e)))
+
+    def _poll_scan_outcome(self, outcome):
+        """Show the custom scan outcome once the scan thread has queued it."""
+        try:
+            kind, payload = outcome.get_nowait()
+        except queue.Empty:
+            self.after(self.RESULT_POLL_MS, self._poll_scan_outcome, outcome)
+            return
+        if kind == "results":
+            self._display_scan_results(payload)
+        else:
+            messagebox.showerror("Scan Error", payload)
 
     def _display_scan_results(self, results):
         """Render the scan results key-value style."""
@@ -1583,10 +2021,10 @@ class DashboardApp(ctk.CTk):
         summary_frame.pack(fill="x", pady=(0, 20), ipady=10)
         
         s = results["summary"]
-        ctk.CTkLabel(summary_frame, text="📊 Scan Summary", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(10,5))
+        ctk.CTkLabel(summary_frame, text="📊 Scan Summary", font=Theme.font(size=16, weight="bold")).pack(pady=(10,5))
         
         info_text = f"Total Files: {s['total_files']}  |  Total Size: {s['total_size_gb']} GB"
-        ctk.CTkLabel(summary_frame, text=info_text, font=ctk.CTkFont(size=14)).pack(pady=5)
+        ctk.CTkLabel(summary_frame, text=info_text, font=Theme.font(size=14)).pack(pady=5)
 
         # Details Grid
         details_container = ctk.CTkFrame(self.results_frame, fg_color="transparent")
@@ -1608,7 +2046,7 @@ class DashboardApp(ctk.CTk):
             header = ctk.CTkFrame(card, fg_color="transparent")
             header.pack(fill="x", padx=10, pady=5)
             
-            ctk.CTkLabel(header, text=cat, font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+            ctk.CTkLabel(header, text=cat, font=Theme.font(size=16, weight="bold")).pack(side="left")
             ctk.CTkLabel(header, text=f"{data['total_count']} files ({data['total_size_mb']} MB)", 
                          text_color="gray").pack(side="right")
             
@@ -1645,18 +2083,18 @@ class DashboardApp(ctk.CTk):
         header_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
         header_frame.pack(fill="x", pady=(0, 20))
         
-        ctk.CTkLabel(header_frame, text="🔒", font=ctk.CTkFont(size=28)).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(header_frame, text="🔒", font=Theme.font(size=28)).pack(side="left", padx=(0, 10))
         ctk.CTkLabel(
             header_frame, 
             text="Sandbox Security", 
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=24, weight="bold")
+            font=Theme.font(family=Theme.FONT_FAMILY, size=24, weight="bold")
         ).pack(side="left")
         
         # Status indicator
         self.sandbox_status_label = ctk.CTkLabel(
             header_frame,
             text="⚫ Inactive",
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=Theme.font(size=14, weight="bold"),
             text_color="gray"
         )
         self.sandbox_status_label.pack(side="right", padx=20)
@@ -1668,14 +2106,14 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             control_frame,
             text="Port Configuration",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=Theme.font(size=16, weight="bold")
         ).pack(pady=(10, 15))
         
         # Port entry
         port_container = ctk.CTkFrame(control_frame, fg_color="transparent")
         port_container.pack(pady=10)
         
-        ctk.CTkLabel(port_container, text="Port:", font=ctk.CTkFont(size=14)).pack(side="left", padx=10)
+        ctk.CTkLabel(port_container, text="Port:", font=Theme.font(size=14)).pack(side="left", padx=10)
         self.port_entry = ctk.CTkEntry(port_container, width=100, placeholder_text="8080")
         self.port_entry.pack(side="left", padx=5)
         
@@ -1725,7 +2163,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             log_header,
             text="📋 Transfer Log",
-            font=ctk.CTkFont(size=16, weight="bold")
+            font=Theme.font(size=16, weight="bold")
         ).pack(side="left")
         
         ctk.CTkButton(
@@ -1775,19 +2213,19 @@ class DashboardApp(ctk.CTk):
         for widget in self.sandbox_ports_scroll.winfo_children():
             widget.destroy()
         if not self.hardware_sandbox:
-            ctk.CTkLabel(self.sandbox_ports_scroll, text="Start monitoring to see ports", font=ctk.CTkFont(size=14), text_color="gray").pack(pady=50)
+            ctk.CTkLabel(self.sandbox_ports_scroll, text="Start monitoring to see ports", font=Theme.font(size=14), text_color="gray").pack(pady=50)
             return
         ports = self.hardware_sandbox.get_monitored_ports()
         if not ports:
-            ctk.CTkLabel(self.sandbox_ports_scroll, text="No ports detected yet", font=ctk.CTkFont(size=14), text_color="gray").pack(pady=50)
+            ctk.CTkLabel(self.sandbox_ports_scroll, text="No ports detected yet", font=Theme.font(size=14), text_color="gray").pack(pady=50)
             return
         usb_count = sum(1 for p in ports.values() if "USB" in p["type"])
         typec_count = sum(1 for p in ports.values() if "Controller" in p["type"])
         hdmi_count = sum(1 for p in ports.values() if "Video" in p["type"])
-        self.sandbox_stats["usb"].set(str(usb_count))
-        self.sandbox_stats["typec"].set(str(typec_count))
-        self.sandbox_stats["hdmi"].set(str(hdmi_count))
-        self.sandbox_stats["transfers"].set(str(len(self.hardware_sandbox.get_logs())))
+        self.sandbox_stats["usb"].configure(text=str(usb_count))
+        self.sandbox_stats["typec"].configure(text=str(typec_count))
+        self.sandbox_stats["hdmi"].configure(text=str(hdmi_count))
+        self.sandbox_stats["transfers"].configure(text=str(len(self.hardware_sandbox.get_logs())))
         for port_id, info in ports.items():
             self._create_port_item(port_id, info)
 
@@ -1817,7 +2255,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             left_frame,
             text=icon,
-            font=ctk.CTkFont(size=24)
+            font=Theme.font(size=24)
         ).pack(expand=True)
         
         # Content
@@ -1828,7 +2266,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             content_frame,
             text=info["name"],
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=Theme.font(size=13, weight="bold"),
             anchor="w"
         ).pack(fill="x", pady=(10, 2))
         
@@ -1837,7 +2275,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             content_frame,
             text=details_text,
-            font=ctk.CTkFont(family="Consolas", size=9),
+            font=Theme.font(family="Consolas", size=9),
             text_color="gray",
             anchor="w"
         ).pack(fill="x")
@@ -1851,7 +2289,7 @@ class DashboardApp(ctk.CTk):
         ctk.CTkLabel(
             time_frame,
             text=f"Hooked at\n{time_str}",
-            font=ctk.CTkFont(size=10),
+            font=Theme.font(size=10),
             anchor="e",
             justify="right"
         ).pack(expand=True)
@@ -1865,13 +2303,13 @@ class DashboardApp(ctk.CTk):
             self.sidebar.update_selection("hardware_sandbox")
         header_frame = ctk.CTkFrame(self.main_container, fg_color="transparent")
         header_frame.pack(fill="x", pady=(0, 20))
-        ctk.CTkLabel(header_frame, text="🔌", font=ctk.CTkFont(size=28)).pack(side="left", padx=(0, 10))
-        ctk.CTkLabel(header_frame, text="Hardware Port Sandbox", font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=24, weight="bold")).pack(side="left")
-        self.hw_sandbox_status_label = ctk.CTkLabel(header_frame, text="⚫ Inactive", font=ctk.CTkFont(size=14, weight="bold"), text_color="gray")
+        ctk.CTkLabel(header_frame, text="🔌", font=Theme.font(size=28)).pack(side="left", padx=(0, 10))
+        ctk.CTkLabel(header_frame, text="Hardware Port Sandbox", font=Theme.font(family=Theme.FONT_FAMILY, size=24, weight="bold")).pack(side="left")
+        self.hw_sandbox_status_label = ctk.CTkLabel(header_frame, text="⚫ Inactive", font=Theme.font(size=14, weight="bold"), text_color="gray")
         self.hw_sandbox_status_label.pack(side="right", padx=20)
         control_frame = ctk.CTkFrame(self.main_container, fg_color=Theme.SECONDARY)
         control_frame.pack(fill="x", pady=(0, 20), ipady=15)
-        ctk.CTkLabel(control_frame, text="Monitor: USB | Type-C | HDMI", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(10, 15))
+        ctk.CTkLabel(control_frame, text="Monitor: USB | Type-C | HDMI", font=Theme.font(size=16, weight="bold")).pack(pady=(10, 15))
         btn_container = ctk.CTkFrame(control_frame, fg_color="transparent")
         btn_container.pack(pady=10)
         self.btn_start_hw_sandbox = ctk.CTkButton(btn_container, text="🚀 Start", command=self._start_hw_sandbox, width=150, fg_color=Theme.SUCCESS, hover_color="#229954")
@@ -1885,7 +2323,7 @@ class DashboardApp(ctk.CTk):
         ports_frame.pack(fill="both", expand=True)
         ports_header = ctk.CTkFrame(ports_frame, fg_color="transparent")
         ports_header.pack(fill="x", padx=15, pady=10)
-        ctk.CTkLabel(ports_header, text="📋 Monitored Ports", font=ctk.CTkFont(size=16, weight="bold")).pack(side="left")
+        ctk.CTkLabel(ports_header, text="📋 Monitored Ports", font=Theme.font(size=16, weight="bold")).pack(side="left")
         ctk.CTkButton(ports_header, text="🔄 Refresh", command=self._refresh_hw_sandbox_view, width=100, height=30).pack(side="right")
         self.hw_sandbox_ports_scroll = ctk.CTkScrollableFrame(ports_frame, fg_color="transparent")
         self.hw_sandbox_ports_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -1920,20 +2358,20 @@ class DashboardApp(ctk.CTk):
         for widget in self.hw_sandbox_ports_scroll.winfo_children():
             widget.destroy()
         if not self.hardware_sandbox:
-            ctk.CTkLabel(self.hw_sandbox_ports_scroll, text="Start monitoring to see ports", font=ctk.CTkFont(size=14), text_color="gray").pack(pady=50)
+            ctk.CTkLabel(self.hw_sandbox_ports_scroll, text="Start monitoring to see ports", font=Theme.font(size=14), text_color="gray").pack(pady=50)
             return
         ports = self.hardware_sandbox.get_monitored_ports()
         if not ports:
-            ctk.CTkLabel(self.hw_sandbox_ports_scroll, text="Scanning for ports...", font=ctk.CTkFont(size=14), text_color="gray").pack(pady=50)
+            ctk.CTkLabel(self.hw_sandbox_ports_scroll, text="Scanning for ports...", font=Theme.font(size=14), text_color="gray").pack(pady=50)
             self.after(2000, self._refresh_hw_sandbox_view)
             return
         usb_count = sum(1 for p in ports.values() if "USB" in p["type"])
         typec_count = sum(1 for p in ports.values() if "Controller" in p["type"])
         hdmi_count = sum(1 for p in ports.values() if "Video" in p["type"])
-        self.hw_sandbox_stats["usb"].set(str(usb_count))
-        self.hw_sandbox_stats["typec"].set(str(typec_count))
-        self.hw_sandbox_stats["hdmi"].set(str(hdmi_count))
-        self.hw_sandbox_stats["transfers"].set(str(len(self.hardware_sandbox.get_logs())))
+        self.hw_sandbox_stats["usb"].configure(text=str(usb_count))
+        self.hw_sandbox_stats["typec"].configure(text=str(typec_count))
+        self.hw_sandbox_stats["hdmi"].configure(text=str(hdmi_count))
+        self.hw_sandbox_stats["transfers"].configure(text=str(len(self.hardware_sandbox.get_logs())))
         for port_id, info in ports.items():
             self._create_hw_port_item(port_id, info)
     
@@ -1946,14 +2384,14 @@ class DashboardApp(ctk.CTk):
         left_frame = ctk.CTkFrame(item_frame, fg_color="transparent", width=60)
         left_frame.pack(side="left", fill="y", padx=10)
         left_frame.pack_propagate(False)
-        ctk.CTkLabel(left_frame, text=icon, font=ctk.CTkFont(size=24)).pack(expand=True)
+        ctk.CTkLabel(left_frame, text=icon, font=Theme.font(size=24)).pack(expand=True)
         content_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
         content_frame.pack(side="left", fill="both", expand=True, padx=5)
-        ctk.CTkLabel(content_frame, text=info["name"], font=ctk.CTkFont(size=13, weight="bold"), anchor="w").pack(fill="x", pady=(10, 2))
+        ctk.CTkLabel(content_frame, text=info["name"], font=Theme.font(size=13, weight="bold"), anchor="w").pack(fill="x", pady=(10, 2))
         details_text = f"{info['type']} | {port_id[:40]}..."
-        ctk.CTkLabel(content_frame, text=details_text, font=ctk.CTkFont(family="Consolas", size=9), text_color="gray", anchor="w").pack(fill="x")
+        ctk.CTkLabel(content_frame, text=details_text, font=Theme.font(family="Consolas", size=9), text_color="gray", anchor="w").pack(fill="x")
         time_frame = ctk.CTkFrame(item_frame, fg_color="transparent", width=120)
         time_frame.pack(side="right", fill="y", padx=10)
         time_frame.pack_propagate(False)
         time_str = info["hooked_at"].strftime("%H:%M:%S")
-        ctk.CTkLabel(time_frame, text=f"Hooked at\n{time_str}", font=ctk.CTkFont(size=10), anchor="e", justify="right").pack(expand=True)
+        ctk.CTkLabel(time_frame, text=f"Hooked at\n{time_str}", font=Theme.font(size=10), anchor="e", justify="right").pack(expand=True)
@@ -1,10 +1,6 @@
 """
 Hardware Port Sandbox - Intercepts physical port communications (USB, Type-C, HDMI)
 """
-try:
-    import wmi  # type: ignore
-except ImportError:
-    wmi = None
 import threading
 import logging
 from typing import Callable, Dict
@@ -17,7 +13,10 @@ class HardwarePortSandbox:
     """Intercepts and secures hardware port communications"""
     
     def __init__(self, validation_callback: Callable = None):
-        if wmi is None:
+        # Imported lazily so the dashboard does not pay for it until monitoring starts
+        try:
+            import wmi  # type: ignore
+        except ImportError:
             raise ImportError("WMI module not available. Install with: pip install wmi")
         self.validation_callback = validation_callback
         self.active = False
@@ -61,6 +61,7 @@ def main():
         
         logger.info("Application started successfully")
         app.mainloop()
+        app.dm.close()
         
     except Exception as e:
         logger.critical(f"Fatal error: {e}", exc_info=True)
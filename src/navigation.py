@@ -28,20 +28,20 @@ class NavigationSidebar(ctk.CTkFrame):
         ctk.CTkLabel(
             logo_container,
             text="⚡",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=32)
+            font=Theme.font(family=Theme.FONT_FAMILY, size=32)
         ).pack()
         
         ctk.CTkLabel(
             logo_container,
             text="DEVICE MONITOR",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=16, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=16, weight="bold"),
             text_color=(Theme.PRIMARY, "#5CA8E0")
         ).pack()
         
         ctk.CTkLabel(
             logo_container,
             text="PRO",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=11, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=11, weight="bold"),
             text_color=Theme.TEXT_SUB
         ).pack()
 
@@ -54,7 +54,7 @@ class NavigationSidebar(ctk.CTkFrame):
             command=self.callbacks.get("dashboard"),
             anchor="w",
             height=45,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14, weight="bold"),
             corner_radius=8,
             hover_color=(Theme.PRIMARY_Hover, "#1A5687")
         )
@@ -68,7 +68,7 @@ class NavigationSidebar(ctk.CTkFrame):
             fg_color="transparent",
             anchor="w",
             height=45,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14),
             corner_radius=8,
             hover_color=(Theme.SECONDARY, "#1F1F1F")
         )
@@ -82,7 +82,7 @@ class NavigationSidebar(ctk.CTkFrame):
             fg_color="transparent",
             anchor="w",
             height=45,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14),
             corner_radius=8,
             hover_color=(Theme.SECONDARY, "#1F1F1F")
         )
@@ -96,7 +96,7 @@ class NavigationSidebar(ctk.CTkFrame):
             fg_color="transparent",
             anchor="w",
             height=45,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14),
             corner_radius=8,
             hover_color=(Theme.SECONDARY, "#1F1F1F")
         )
@@ -110,7 +110,7 @@ class NavigationSidebar(ctk.CTkFrame):
             fg_color="transparent",
             anchor="w",
             height=45,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14),
             corner_radius=8,
             hover_color=(Theme.SECONDARY, "#1F1F1F")
         )
@@ -124,7 +124,7 @@ class NavigationSidebar(ctk.CTkFrame):
             fg_color="transparent",
             anchor="w",
             height=45,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14),
             corner_radius=8,
             hover_color=(Theme.SECONDARY, "#1F1F1F")
         )
@@ -146,13 +146,13 @@ class NavigationSidebar(ctk.CTkFrame):
         ctk.CTkLabel(
             user_container,
             text="👤",
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=14)
+            font=Theme.font(family=Theme.FONT_FAMILY, size=14)
         ).pack(side="left", padx=(0, 8))
         
         self.user_label = ctk.CTkLabel(
             user_container,
             text=self.user_profile.name,
-            font=ctk.CTkFont(family=Theme.FONT_FAMILY, size=12, weight="bold"),
+            font=Theme.font(family=Theme.FONT_FAMILY, size=12, weight="bold"),
             text_color=(Theme.PRIMARY, "#5CA8E0")
         )
         self.user_label.pack(side="left")
@@ -162,7 +162,7 @@ class NavigationSidebar(ctk.CTkFrame):
         # Reset all
         common_style = {
             "fg_color": "transparent",
-            "font": ctk.CTkFont(family=Theme.FONT_FAMILY, size=14)
+            "font": Theme.font(family=Theme.FONT_FAMILY, size=14)
         }
         
         self.dash_btn.configure(**common_style)
@@ -178,7 +178,7 @@ class NavigationSidebar(ctk.CTkFrame):
         # Highlight active
         active_style = {
             "fg_color": (Theme.PRIMARY, "#1F6AA5"),
-            "font": ctk.CTkFont(family=Theme.FONT_FAMILY, size=14, weight="bold")
+            "font": Theme.font(family=Theme.FONT_FAMILY, size=14, weight="bold")
         }
         
         if view_name == "dashboard":
@@ -6,7 +6,7 @@ import json
 import os
 import datetime
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable
 from enum import Enum
 
 ACTIVITY_LOG_FILE = "system_activity.json"
@@ -36,6 +36,8 @@ class ActivityLog:
         """Initialize activity log with default values."""
         self.activities: List[Dict] = []
         self.current_devices: Dict[str, Dict] = {}  # Track current device state
+        self.version = 0  # Bumped whenever activities change, for callers caching views of them
+        self._stats_cache: Optional[tuple] = None  # (version, date, statistics)
         self.load()
         self.log_activity(ActivityType.SYSTEM_STARTUP, "System Monitor Started", "System")
     
@@ -43,7 +45,8 @@ class ActivityLog:
                     activity_type: ActivityType, 
                     message: str, 
                     device_name: str = "System",
-                    details: Optional[Dict] = None) -> None:
+                    details: Optional[Dict] = None,
+                    save: bool = True) -> None:
         """
         Log a system activity.
         
@@ -52,6 +55,7 @@ class ActivityLog:
             message: Activity description
             device_name: Name of the device or "System"
             details: Additional details dictionary
+            save: Write the log file now; callers logging a batch pass False and save once
         """
         timestamp = datetime.datetime.now()
         
@@ -66,13 +70,15 @@ class ActivityLog:
         }
         
         self.activities.append(activity)
+        self.version += 1
         
         # Keep only last MAX_LOG_ENTRIES
         if len(self.activities) > MAX_LOG_ENTRIES:
             self.activities = self.activities[-MAX_LOG_ENTRIES:]
         
         # Auto-save every activity
-        self.save()
+        if save:
+            self.save()
         
         logger.info(f"{activity_type.value}: {message}")
     
@@ -95,11 +101,16 @@ class ActivityLog:
             current_devices: List of currently detected devices
         """
         current_device_paths = {d.get('path'): d for d in current_devices if d.get('path')}
-        previous_paths = set(self.current_devices.keys())
-        current_paths = set(current_device_paths.keys())
+        current_paths = current_device_paths.keys()
+        previous_paths = self.current_devices.keys()
         
-        # Detect newly connected devices
+        # Usual case: the same devices as last scan, nothing to log or save
         new_devices = current_paths - previous_paths
+        removed_devices = previous_paths - current_paths
+        if not new_devices and not removed_devices:
+            return
+        
+        # Detect newly connected devices
         for path in new_devices:
             device = current_device_paths[path]
             self.log_activity(
@@ -111,11 +122,11 @@ class ActivityLog:
                     'manufacturer': device.get('manufacturer', 'Unknown'),
                     'vid': device.get('vid', 'N/A'),
                     'pid': device.get('pid', 'N/A')
-                }
+                },
+                save=False
             )
         
         # Detect disconnected devices
-        removed_devices = previous_paths - current_paths
         for path in removed_devices:
             device = self.current_devices[path]
             self.log_activity(
@@ -125,11 +136,17 @@ class ActivityLog:
                 {
                     'category': device.get('category', 'Unknown'),
                     'last_seen': datetime.datetime.now().isoformat()
-                }
+                },
+                save=False
             )
         
-        # Update current device state
-        self.current_devices = current_device_paths
+        # Update current device state; only what a disconnect entry needs is
+        # kept, since the snapshot is saved with the log
+        self.current_devices = {
+            path: {'name': d.get('name', 'Unknown Device'), 'category': d.get('category', 'Unknown')}
+            for path, d in current_device_paths.items()
+        }
+        self.save()
     
     def get_recent_activities(self, limit: int = 50) -> List[Dict]:
         """
@@ -157,6 +174,21 @@ class ActivityLog:
         filtered = [a for a in self.activities if a['type'] == activity_type.value]
         return list(reversed(filtered[-limit:]))
     
+    def get_activities_by_types(self, activity_types: Iterable[ActivityType], limit: int = 50) -> List[Dict]:
+        """
+        Get activities matching any of several types, newest first.
+        
+        Args:
+            activity_types: Types of activity to include
+            limit: Maximum number of activities to return
+            
+        Returns:
+            List of filtered activity dictionaries
+        """
+        values = {t.value for t in activity_types}
+        filtered = [a for a in self.activities if a['type'] in values]
+        return list(reversed(filtered[-limit:]))
+    
     def get_activities_by_device(self, device_name: str, limit: int = 50) -> List[Dict]:
         """
         Get activities for a specific device.
@@ -178,6 +210,13 @@ class ActivityLog:
         Returns:
             Dictionary containing various statistics
         """
+        # Recomputed only when activities change or the day rolls over. The
+        # version is read first so a concurrent log_activity leaves the cache stale
+        version = self.version
+        today = datetime.date.today()
+        if self._stats_cache is not None and self._stats_cache[:2] == (version, today):
+            return self._stats_cache[2]
+        
         total = len(self.activities)
         
         # Count by type
@@ -194,13 +233,12 @@ class ActivityLog:
             severity_counts[severity] += 1
         
         # Get today's activities
-        today = datetime.date.today()
         today_activities = [
             a for a in self.activities 
             if datetime.datetime.fromisoformat(a['timestamp']).date() == today
         ]
         
-        return {
+        statistics = {
             'total_activities': total,
             'today_activities': len(today_activities),
             'devices_connected_today': sum(1 for a in today_activities if a['type'] == ActivityType.DEVICE_CONNECTED.value),
@@ -210,11 +248,14 @@ class ActivityLog:
             'oldest_entry': self.activities[0]['timestamp'] if self.activities else None,
             'newest_entry': self.activities[-1]['timestamp'] if self.activities else None
         }
+        self._stats_cache = (version, today, statistics)
+        return statistics
     
     def clear_logs(self) -> None:
         """Clear all activity logs."""
         self.activities = []
         self.current_devices = {}
+        self.version += 1
         self.save()
         logger.info("Activity logs cleared")
     
@@ -269,6 +310,7 @@ class ActivityLog:
                 data = json.load(f)
                 self.activities = data.get("activities", [])
                 self.current_devices = data.get("current_devices", {})
+            self.version += 1
             logger.info(f"Activity log loaded: {len(self.activities)} entries")
             return True
         except json.JSONDecodeError as e:
@@ -1,6 +1,11 @@
 """
 Theme configuration for Device Monitor Pro.
 """
+import functools
+from typing import Optional
+
+import customtkinter as ctk
+
 
 class Theme:
     """Application theme colors and fonts."""
@@ -23,3 +28,10 @@ class Theme:
     
     # Fonts
     FONT_FAMILY = "Segoe UI"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def font(size: Optional[int] = None, weight: Optional[str] = None,
+             family: Optional[str] = None) -> ctk.CTkFont:
+        """Return a shared CTkFont, so rebuilding widgets doesn't allocate new Tk fonts."""
+        return ctk.CTkFont(family=family, size=size, weight=weight)
@@ -28,6 +28,7 @@ class UserProfile:
         self.unique_id: str = "HID-SEC-8829-X"
         self.password: str = "admin123"  # In real app, never store plaintext!
         self.security_key: str = self._generate_security_key()
+        self._password_hash: Optional[tuple] = None  # (password, hex digest)
         self.load()
     
     def _generate_security_key(self) -> str:
@@ -35,8 +36,10 @@ class UserProfile:
         return secrets.token_hex(16)
     
     def get_password_hash(self) -> str:
-        """Get SHA-256 hash of the password."""
-        return hashlib.sha256(self.password.encode()).hexdigest()
+        """Get SHA-256 hash of the password, recomputed only when the password changes."""
+        if self._password_hash is None or self._password_hash[0] != self.password:
+            self._password_hash = (self.password, hashlib.sha256(self.password.encode()).hexdigest())
+        return self._password_hash[1]
 
     def load(self) -> bool:
         """